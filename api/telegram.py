@@ -5,13 +5,84 @@ This module provides functions for sending messages and retrieving updates from
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 import os
+import time
+import threading
+from collections import OrderedDict
 from utils.config import Config
 from utils.logging import get_logger
+from utils.rate_limit import TokenBucket
 
 logger = get_logger(__name__)
 
+# Bot API endpoints and settings, resolved once at import
+_API_BASE = f"https://api.telegram.org/bot{Config.TELEGRAM_TOKEN}"
+_SEND_MESSAGE_URL = f"{_API_BASE}/sendMessage"
+_GET_UPDATES_URL = f"{_API_BASE}/getUpdates"
+_REQUEST_TIMEOUT = Config.REQUEST_TIMEOUT
+
+# Shared HTTP session so sends and polls reuse keep-alive TLS connections to
+# api.telegram.org; the pool is sized for the update workers, the ack
+# senders and the polling thread
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Outbound send pacing, kept under Telegram's limits: about 30 messages per
+# second overall and about one per second per chat (with a short burst)
+GLOBAL_SEND_RATE = 30
+CHAT_SEND_RATE = 1
+CHAT_SEND_BURST = 3
+MAX_TRACKED_CHATS = 4096
+
+_global_bucket = TokenBucket(GLOBAL_SEND_RATE, GLOBAL_SEND_RATE)
+_chat_buckets = OrderedDict()
+_chat_buckets_lock = threading.Lock()
+
+def _chat_bucket(chat_id):
+    """Return the send bucket for a chat, evicting the least recently used one."""
+    with _chat_buckets_lock:
+        bucket = _chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(CHAT_SEND_RATE, CHAT_SEND_BURST)
+            _chat_buckets[chat_id] = bucket
+            if len(_chat_buckets) > MAX_TRACKED_CHATS:
+                _chat_buckets.popitem(last=False)
+        else:
+            _chat_buckets.move_to_end(chat_id)
+        return bucket
+
+# getUpdates long-poll settings: Telegram holds the request open for up to
+# POLL_TIMEOUT seconds waiting for updates; the HTTP timeout adds a margin
+POLL_TIMEOUT = 30
+POLL_HTTP_MARGIN = 10
+GET_UPDATES_LIMIT = 100
+
+# Retries for a message rejected with HTTP 429 (flood control)
+SEND_MAX_RETRIES = 3
+
+def _get_retry_after(response):
+    """
+    Get the flood-control wait from a 429 response.
+    
+    Telegram reports it in ``parameters.retry_after``; the Retry-After
+    header is used as a fallback.
+    
+    Returns:
+        float: Seconds to wait before retrying
+    """
+    try:
+        retry_after = response.json().get("parameters", {}).get("retry_after")
+    except ValueError:
+        retry_after = None
+    if retry_after is None:
+        retry_after = response.headers.get("Retry-After", 1)
+    try:
+        return max(float(retry_after), 0.0) + 0.5
+    except (TypeError, ValueError):
+        return 1.5
+
 def send_telegram(message, chat_id, parse_mode="Markdown"):
     """
     Send a message to a Telegram chat.
@@ -25,14 +96,25 @@ def send_telegram(message, chat_id, parse_mode="Markdown"):
         dict: The response from the Telegram API, or None on error
     """
     try:
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_TOKEN}/sendMessage"
         payload = {
             "chat_id": chat_id,
             "text": message,
             "parse_mode": parse_mode
         }
         
-        response = requests.post(url, json=payload)
+        chat_bucket = _chat_bucket(chat_id)
+        for attempt in range(SEND_MAX_RETRIES + 1):
+            # Wait for the chat's own budget first so a busy chat does not
+            # hold global tokens it cannot use yet
+            chat_bucket.acquire()
+            _global_bucket.acquire()
+            response = _session.post(_SEND_MESSAGE_URL, json=payload, timeout=_REQUEST_TIMEOUT)
+            if response.status_code != 429 or attempt == SEND_MAX_RETRIES:
+                break
+            # Flood control: wait as long as Telegram asks, then retry
+            retry_after = _get_retry_after(response)
+            logger.warning(f"Telegram rate limit hit for chat {chat_id}, retrying in {retry_after}s")
+            time.sleep(retry_after)
         response.raise_for_status()
         
         data = response.json()
@@ -59,39 +141,54 @@ def send_telegram_with_markup(text, chat_id, reply_markup):
     except Exception as e:
         logger.error(f"Error sending markup message: {e}")
 
-def get_updates(offset=None, timeout=30):
+def _is_actionable(update):
+    """Return True for updates the bot handles: text messages and callback data."""
+    message = update.get("message")
+    if message is not None:
+        return bool(message.get("text"))
+    callback_query = update.get("callback_query")
+    return callback_query is not None and bool(callback_query.get("data"))
+
+def get_updates(offset=None, timeout=POLL_TIMEOUT):
     """
     Get updates from the Telegram API.
     
     Args:
         offset (int, optional): The offset ID for updates
-        timeout (int, optional): Long polling timeout in seconds
+        timeout (int, optional): Long polling timeout in seconds; 0 returns
+            immediately with whatever is already queued
         
     Returns:
-        list: List of update objects, or empty list on error
+        list: List of update objects (empty when a long poll times out), or
+        None on error. Updates the bot does not act on (photos, stickers,
+        empty callbacks) are reduced to their update_id.
     """
     try:
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_TOKEN}/getUpdates"
         payload = {
             "timeout": timeout,
+            "limit": GET_UPDATES_LIMIT,
             "allowed_updates": ["message", "callback_query"]
         }
         
         if offset:
             payload["offset"] = offset
             
-        response = requests.post(url, json=payload)
+        response = _session.post(_GET_UPDATES_URL, json=payload, timeout=timeout + POLL_HTTP_MARGIN)
         response.raise_for_status()
         
         data = response.json()
         if data.get("ok"):
-            return data.get("result", [])
+            # Keep only what the handlers act on; the rest just advances the offset
+            return [
+                update if _is_actionable(update) else {"update_id": update.get("update_id")}
+                for update in data.get("result", [])
+            ]
         else:
             logger.error(f"Failed to get updates: {data.get('description')}")
-            return []
+            return None
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error getting telegram updates: {str(e)}")
-        return []
+        return None
     except Exception as e:
         logger.error(f"Error getting telegram updates: {str(e)}")
-        return []
\ No newline at end of file
+        return None
\ No newline at end of file
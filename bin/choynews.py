@@ -10,6 +10,7 @@ import time
 import logging
 import threading
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -31,6 +32,9 @@ from data_modules.models import (
 )
 from utils.time_utils import get_bd_now, should_send_news
 
+# Concurrent digest deliveries per scheduled run
+DIGEST_WORKERS = 4
+
 def run_bot():
     """Run the interactive Telegram bot."""
     logger = get_logger("bot")
@@ -45,6 +49,31 @@ def run_bot():
         logger.error(f"Error running bot: {e}", exc_info=True)
         raise
 
+def deliver_digest(user, logger):
+    """Build and send the scheduled news digest for one user."""
+    try:
+        # Check if we should send news to this user
+        if not should_send_news(user):
+            return
+            
+        # Build personalized digest
+        digest = build_news_digest(user)
+        if not digest:
+            logger.warning(f"No digest generated for user {user.get('user_id')}")
+            return
+        
+        # Send digest to user
+        chat_id = user.get("chat_id")
+        if chat_id and send_telegram(digest, chat_id):
+            # Update last sent time only on success
+            update_last_sent(user.get("user_id"))
+            logger.info(f"Sent news digest to user {user.get('user_id')}")
+        else:
+            logger.error(f"Failed to send digest to user {user.get('user_id')}")
+            
+    except Exception as e:
+        logger.error(f"Error processing user {user.get('user_id')}: {e}")
+
 def run_auto_news():
     """Run the automated news delivery service."""
     logger = get_logger("auto_news")
@@ -67,29 +96,10 @@ def run_auto_news():
                 
                 if users:
                     logger.info(f"Found {len(users)} users for scheduled time {current_time}")
-                    for user in users:
-                        try:
-                            # Check if we should send news to this user
-                            if not should_send_news(user):
-                                continue
-                                
-                            # Build personalized digest
-                            digest = build_news_digest(user)
-                            if not digest:
-                                logger.warning(f"No digest generated for user {user.get('user_id')}")
-                                continue
-                            
-                            # Send digest to user
-                            chat_id = user.get("chat_id")
-                            if chat_id and send_telegram(digest, chat_id):
-                                # Update last sent time only on success
-                                update_last_sent(user.get("user_id"))
-                                logger.info(f"Sent news digest to user {user.get('user_id')}")
-                            else:
-                                logger.error(f"Failed to send digest to user {user.get('user_id')}")
-                                
-                        except Exception as e:
-                            logger.error(f"Error processing user {user.get('user_id')}: {e}")
+                    # Digests are built from network fetches, so deliver them concurrently
+                    with ThreadPoolExecutor(max_workers=DIGEST_WORKERS, thread_name_prefix="digest") as executor:
+                        for user in users:
+                            executor.submit(deliver_digest, user, logger)
                 
                 # Sleep for 1 minute
                 time.sleep(60)
@@ -2,16 +2,22 @@
 Configuration factory for ChoyNewsBot.
 """
 import os
+from functools import lru_cache
 from .base_config import BaseConfig
 from .dev_config import DevelopmentConfig
 from .prod_config import ProductionConfig
 from .test_config import TestingConfig
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """
     Get configuration based on environment.
     
+    The environment is read and the class initialized once per process;
+    later calls return the same class. Use ``get_config.cache_clear()`` to
+    re-read ENVIRONMENT (e.g. in tests).
+    
     Returns:
         Config class appropriate for current environment
     """
@@ -61,6 +61,9 @@ class BaseConfig:
     RATE_LIMIT_PER_MINUTE = 60
     RATE_LIMIT_BURST = 10
     
+    # Set by init_app() so directory and logging setup runs once per class
+    _initialized = False
+    
     @classmethod
     def validate(cls):
         """Validate that required configuration is present."""
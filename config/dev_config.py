@@ -46,6 +46,9 @@ class DevelopmentConfig(BaseConfig):
     @classmethod
     def init_app(cls, app=None):
         """Initialize development-specific settings."""
+        if cls._initialized:
+            return
+        
         # Ensure development directories exist
         os.makedirs("logs", exist_ok=True)
         os.makedirs("data", exist_ok=True)
@@ -57,3 +60,6 @@ class DevelopmentConfig(BaseConfig):
             level=logging.DEBUG,
             format='%(asctime)s [%(levelname)s] %(name)s: %(message)s'
         )
+        
+        # Set last, so a failed setup is retried by the next call
+        cls._initialized = True
@@ -2,8 +2,58 @@
 Production configuration for ChoyNewsBot.
 """
 import os
+from urllib.parse import quote_plus
 from .base_config import BaseConfig
 
+# Read the environment once at import; class attributes below reuse these
+_getenv = os.environ.get
+
+
+def _database_url():
+    """Build the production database URL, falling back to SQLite without PostgreSQL credentials."""
+    pg_user = _getenv("POSTGRES_USER")
+    pg_password = _getenv("POSTGRES_PASSWORD")
+    if not (pg_user and pg_password):
+        return "sqlite:///data/choynews_production.db"
+    database_url = _getenv("DATABASE_URL")
+    if database_url:
+        return database_url
+    return (f"postgresql://{quote_plus(pg_user)}:{quote_plus(pg_password)}@"
+            f"{_getenv('POSTGRES_HOST', 'localhost')}:"
+            f"{_getenv('POSTGRES_PORT', '5432')}/"
+            f"{_getenv('POSTGRES_DB', 'choynews')}")
+
+
+class _LazyEnv:
+    """Class attribute built from the environment on first access, then cached on the class."""
+    
+    def __init__(self, build, *args):
+        self._build = build
+        self._args = args
+    
+    def __set_name__(self, owner, name):
+        self._name = name
+    
+    def __get__(self, instance, owner):
+        value = self._build(*self._args)
+        # Replace the descriptor so later reads are plain attribute lookups
+        setattr(owner, self._name, value)
+        return value
+
+
+def _load_logging_cfg(path="config/logging.json"):
+    """Load the structured logging configuration."""
+    import json
+    
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _csv_set(name):
+    """Parse a comma-separated environment variable into a set of non-empty values."""
+    value = _getenv(name)
+    return frozenset(value.split(",")) - {""} if value else frozenset()
+
 
 class ProductionConfig(BaseConfig):
     """Production environment configuration."""
@@ -13,22 +63,13 @@ class ProductionConfig(BaseConfig):
     TESTING = False
     
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE = os.getenv("LOG_FILE", "logs/choynews.log")
-    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", 20971520))  # 20MB
-    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", 10))
-    
-    # Database (prefer PostgreSQL for production)
-    DATABASE_URL = os.getenv("DATABASE_URL", 
-                            f"postgresql://{os.getenv('POSTGRES_USER', 'choynews')}:"
-                            f"{os.getenv('POSTGRES_PASSWORD', '')}@"
-                            f"{os.getenv('POSTGRES_HOST', 'localhost')}:"
-                            f"{os.getenv('POSTGRES_PORT', '5432')}/"
-                            f"{os.getenv('POSTGRES_DB', 'choynews')}")
-    
-    # Fallback to SQLite if PostgreSQL not configured
-    if not all([os.getenv('POSTGRES_USER'), os.getenv('POSTGRES_PASSWORD')]):
-        DATABASE_URL = "sqlite:///data/choynews_production.db"
+    LOG_LEVEL = _getenv("LOG_LEVEL", "INFO")
+    LOG_FILE = _getenv("LOG_FILE", "logs/choynews.log")
+    LOG_MAX_BYTES = int(_getenv("LOG_MAX_BYTES", 20971520))  # 20MB
+    LOG_BACKUP_COUNT = int(_getenv("LOG_BACKUP_COUNT", 10))
+    
+    # Database (prefer PostgreSQL, fall back to SQLite if it is not configured)
+    DATABASE_URL = _LazyEnv(_database_url)
     
     # API timeouts (production values)
     API_TIMEOUT = 30
@@ -39,10 +80,10 @@ class ProductionConfig(BaseConfig):
     REDIS_TTL = 3600  # 1 hour
     
     # Redis configuration
-    REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
-    REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
-    REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
-    REDIS_DB = int(os.getenv("REDIS_DB", 0))
+    REDIS_HOST = _getenv("REDIS_HOST", "localhost")
+    REDIS_PORT = int(_getenv("REDIS_PORT", 6379))
+    REDIS_PASSWORD = _getenv("REDIS_PASSWORD")
+    REDIS_DB = int(_getenv("REDIS_DB", 0))
     
     # Rate limiting (stricter for production)
     RATE_LIMIT_PER_MINUTE = 60
@@ -55,12 +96,12 @@ class ProductionConfig(BaseConfig):
     NEWS_RETENTION_DAYS = 7
     
     # Security settings
-    ALLOWED_USERS = os.getenv("ALLOWED_USERS", "").split(",") if os.getenv("ALLOWED_USERS") else []
-    ADMIN_USERS = os.getenv("ADMIN_USERS", "").split(",") if os.getenv("ADMIN_USERS") else []
+    ALLOWED_USERS = _LazyEnv(_csv_set, "ALLOWED_USERS")
+    ADMIN_USERS = _LazyEnv(_csv_set, "ADMIN_USERS")
     
     # SSL/TLS
-    SSL_CERT_PATH = os.getenv("SSL_CERT_PATH")
-    SSL_KEY_PATH = os.getenv("SSL_KEY_PATH")
+    SSL_CERT_PATH = _getenv("SSL_CERT_PATH")
+    SSL_KEY_PATH = _getenv("SSL_KEY_PATH")
     
     # Production features
     ENABLE_DEBUG_ENDPOINTS = False
@@ -69,7 +110,7 @@ class ProductionConfig(BaseConfig):
     
     # Monitoring
     ENABLE_METRICS = True
-    METRICS_PORT = int(os.getenv("METRICS_PORT", 8080))
+    METRICS_PORT = int(_getenv("METRICS_PORT", 8080))
     HEALTH_CHECK_INTERVAL = 60
     
     # Performance optimization
@@ -80,28 +121,43 @@ class ProductionConfig(BaseConfig):
     @classmethod
     def init_app(cls, app=None):
         """Initialize production-specific settings."""
-        # Ensure production directories exist with proper permissions
-        import stat
+        if cls._initialized:
+            return
         
+        # Ensure production directories exist with proper permissions
         directories = ["logs", "data", "data/cache", "data/static"]
         for directory in directories:
             os.makedirs(directory, mode=0o755, exist_ok=True)
         
         # Production logging setup with structured logging
-        import logging.config
-        import json
+        import logging
         
         try:
-            with open("config/logging.json", "r") as f:
-                logging_config = json.load(f)
-                logging.config.dictConfig(logging_config)
+            logging_config = _load_logging_cfg()
+            import logging.config
+            logging.config.dictConfig(logging_config)
         except FileNotFoundError:
-            # Fallback to basic logging
+            # Fallback to basic logging. Worker threads only enqueue records;
+            # a single listener thread formats and writes them, so log calls
+            # do not contend on the file and stream handler locks
+            import atexit
+            import logging.handlers
+            import queue
+            
+            formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+            handlers = [logging.FileHandler(cls.LOG_FILE), logging.StreamHandler()]
+            for handler in handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            
             logging.basicConfig(
                 level=logging.INFO,
-                format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
-                handlers=[
-                    logging.FileHandler(cls.LOG_FILE),
-                    logging.StreamHandler()
-                ]
+                handlers=[logging.handlers.QueueHandler(log_queue)]
             )
+        
+        # Set last, so a failed setup is retried by the next call
+        cls._initialized = True
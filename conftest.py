@@ -11,11 +11,13 @@ import logging
 import threading
 import argparse
 from dotenv import load_dotenv
-from pathlib import Path
 
 # Add project root to path for imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# (conftest.py lives in the project root; only insert it once even if
+# pytest loads this module more than once)
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from utils.config import Config
 from utils.logging import setup_logging, get_logger
@@ -5,62 +5,130 @@ This module fetches real-time breaking news, crypto data with AI analysis,
 and weather data while ensuring no duplicate news across time slots.
 """
 
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import feedparser
 import json
+import math
 import os
 import sqlite3
+import sys
 import time
+import threading
 import re
 import hashlib
-import pytz
+import heapq
+import io
+import xml.etree.ElementTree as ET
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import chain
+from operator import itemgetter
+from urllib.parse import urlparse
 from utils.logging import get_logger
 from utils.config import Config
-from utils.time_utils import get_bd_now
+from utils.cache import ttl_cache, TTLCache
+from utils.rate_limit import TokenBucket
+from utils.time_utils import get_bd_now, parse_feed_datetime
+from data_modules.crypto_cache import cache_coingecko_ids, get_cached_coingecko_ids
+
+# orjson decodes the larger API payloads (CoinGecko markets, coin list) several
+# times faster than the stdlib parser; it is optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = get_logger(__name__)
 
 # Rate limiting and caching globals
-_last_request_times = {}
-_cache = {}
+# Per-domain token buckets. Tokens are seconds of spacing: a bucket refills
+# one token per second and a request costs its min_interval, so the steady
+# rate per domain is one request per min_interval while a short burst (up to
+# DOMAIN_BURST_SECONDS worth) can go out without waiting.
+DOMAIN_BURST_SECONDS = 3.0
+_domain_buckets = {}
+_domain_buckets_lock = threading.Lock()
+# Responses are cached per host group so frequent CoinGecko calls cannot
+# evict feed and weather responses from the LRU, and vice versa
+_cache = TTLCache(maxsize=256)
+_coingecko_cache = TTLCache(maxsize=128)
 _cache_duration = 300  # 5 minutes cache for most data
 _coingecko_cache_duration = 120  # 2 minutes for crypto data
 _rss_cache_duration = 180  # 3 minutes for RSS feeds
 
-def _cleanup_cache():
-    """Clean up expired cache entries to prevent memory buildup."""
-    current_time = time.time()
-    expired_keys = []
-    
-    for key, (_, cached_time) in _cache.items():
-        if current_time - cached_time > _cache_duration * 2:  # Clean up items older than 2x cache duration
-            expired_keys.append(key)
-    
-    for key in expired_keys:
-        del _cache[key]
+# Scored entries per RSS source, see _fetch_source_entries
+_feed_entries_cache = TTLCache(maxsize=128)
+
+# Last good response per request with its ETag/Last-Modified validators, kept
+# past the cache TTL so a refresh can be a conditional GET answered with 304
+_validators = TTLCache(maxsize=256)
+_validator_duration = 86400  # 1 day
+
+# Shared HTTP session so repeated calls to the same hosts (CoinGecko, RSS
+# domains, DeepSeek) reuse keep-alive TLS connections. Idempotent requests
+# are retried briefly on transient gateway errors.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'ChoyNewsBot/2.0 (Telegram Bot)'})
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, status_forcelist=[502, 503, 504], backoff_factor=0.3, raise_on_status=False)
+)
+_SESSION.mount("http://", _HTTP_ADAPTER)
+_SESSION.mount("https://", _HTTP_ADAPTER)
+
+# RSS domains are fetched on one shared pool, so threads are reused across
+# calls and concurrent categories together stay within the HTTP pool size.
+# Threads are started on demand.
+RSS_FETCH_WORKERS = 16
+_rss_executor = ThreadPoolExecutor(max_workers=RSS_FETCH_WORKERS, thread_name_prefix="rss-fetch")
+
+def _freeze(value):
+    """Turn request kwargs (dicts, lists) into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+@functools.lru_cache(maxsize=512)
+def _url_domain(url):
+    """Return the interned host of a URL; the fetcher hits the same few URLs repeatedly."""
+    return sys.intern(urlparse(url).netloc)
+
+def _domain_bucket(domain):
+    """Return the token bucket for a domain, creating it once."""
+    bucket = _domain_buckets.get(domain)
+    if bucket is None:
+        with _domain_buckets_lock:
+            bucket = _domain_buckets.setdefault(domain, TokenBucket(1.0, DOMAIN_BURST_SECONDS))
+    return bucket
+
+def _wait_for_domain(domain, min_interval, kind="request"):
+    """
+    Block until a request to ``domain`` is allowed under its token bucket.
     
-    if expired_keys:
-        logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+    Concurrent callers reserve tokens in turn, so they are released
+    ``min_interval`` apart once the burst allowance is used up.
+    """
+    sleep_time = _domain_bucket(domain).reserve(min_interval)
+    if sleep_time > 0:
+        logger.debug(f"Rate limiting {kind}: sleeping {sleep_time:.2f}s for {domain}")
+        time.sleep(sleep_time)
 
 def _rate_limited_post(url, min_interval=1.0, timeout=10, **kwargs):
     """Make a rate-limited HTTP POST request."""
-    current_time = time.time()
-    
     # Rate limiting
-    domain = url.split('/')[2]  # Extract domain for per-domain rate limiting
-    last_request = _last_request_times.get(domain, 0)
-    time_since_last = current_time - last_request
-    
-    if time_since_last < min_interval:
-        sleep_time = min_interval - time_since_last
-        logger.debug(f"Rate limiting POST: sleeping {sleep_time:.2f}s for {domain}")
-        time.sleep(sleep_time)
+    domain = _url_domain(url)  # Per-domain rate limiting
+    _wait_for_domain(domain, min_interval, "POST")
     
     try:
-        # Update last request time
-        _last_request_times[domain] = time.time()
-        
         # Make POST request with proper headers
         headers = kwargs.get('headers', {})
         headers.update({
@@ -70,69 +138,81 @@ def _rate_limited_post(url, min_interval=1.0, timeout=10, **kwargs):
         })
         kwargs['headers'] = headers
         
-        response = requests.post(url, timeout=timeout, **kwargs)
+        response = _SESSION.post(url, timeout=timeout, **kwargs)
         return response
         
     except Exception as e:
         logger.error(f"Rate limited POST request failed for {url}: {e}")
         raise
 
-def _rate_limited_request(url, min_interval=1.0, timeout=10, **kwargs):
-    """Make a rate-limited HTTP request with caching."""
-    current_time = time.time()
+def _rate_limited_request(url, min_interval=1.0, timeout=10, cache_ttl=None, **kwargs):
+    """
+    Make a rate-limited HTTP request with caching.
     
-    # Periodic cache cleanup
-    if len(_cache) > 100:  # Clean up when cache gets large
-        _cleanup_cache()
+    Successful responses are cached for ``cache_ttl`` seconds; by default
+    CoinGecko responses are kept for 2 minutes and everything else for 5.
+    """
+    domain = _url_domain(url)
+    is_coingecko = domain.endswith("coingecko.com")
+    cache = _coingecko_cache if is_coingecko else _cache
     
     # Check cache first
-    cache_key = f"{url}_{hash(str(sorted(kwargs.items())))}"
-    if cache_key in _cache:
-        cached_data, cached_time = _cache[cache_key]
-        cache_duration = _coingecko_cache_duration if 'coingecko.com' in url else _cache_duration
-        if current_time - cached_time < cache_duration:
-            logger.debug(f"Using cached data for {url}")
-            return cached_data
+    cache_key = (url, _freeze(kwargs))
+    cached_data = cache.get(cache_key)
+    if cached_data is not None:
+        logger.debug(f"Using cached data for {url}")
+        return cached_data
     
     # Rate limiting
-    domain = url.split('/')[2]  # Extract domain for per-domain rate limiting
-    last_request = _last_request_times.get(domain, 0)
-    time_since_last = current_time - last_request
-    
-    if time_since_last < min_interval:
-        sleep_time = min_interval - time_since_last
-        logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s for {domain}")
-        time.sleep(sleep_time)
+    _wait_for_domain(domain, min_interval)
     
     try:
-        # Update last request time
-        _last_request_times[domain] = time.time()
-        
-        # Make request with proper headers to reduce 429 errors
+        # Make request with proper headers to reduce 429 errors.
+        # Accept-Encoding lists what urllib3 can decode (adds br when a
+        # brotli package is installed)
         headers = kwargs.get('headers', {})
         headers.update({
             'User-Agent': 'ChoyNewsBot/2.0 (Telegram Bot)',
             'Accept': 'application/json, application/rss+xml, text/xml, */*',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive'
         })
+        
+        # Revalidate a previous response instead of downloading it again
+        validated = _validators.get(cache_key)
+        if validated is not None:
+            _, etag, last_modified = validated
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
         kwargs['headers'] = headers
         
-        response = requests.get(url, timeout=timeout, **kwargs)
+        response = _SESSION.get(url, timeout=timeout, **kwargs)
         
         # Handle rate limiting responses specifically
         if response.status_code == 429:
             logger.warning(f"Rate limited by {domain}, waiting 10 seconds...")
             time.sleep(10)
-            # Update rate limit for this domain
-            _last_request_times[domain] = time.time()
             # Try one more time with longer interval
-            time.sleep(min_interval * 2)
-            response = requests.get(url, timeout=timeout, **kwargs)
+            _wait_for_domain(domain, min_interval * 2)
+            response = _SESSION.get(url, timeout=timeout, **kwargs)
+        
+        # Unchanged since the last fetch: reuse the stored response
+        if response.status_code == 304 and validated is not None:
+            logger.debug(f"Not modified, reusing previous response for {url}")
+            response = validated[0]
+        elif response.status_code == 200:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                _validators.set(cache_key, (response, etag, last_modified), _validator_duration)
         
         # Cache successful responses
         if response.status_code == 200:
-            _cache[cache_key] = (response, current_time)
+            if cache_ttl is None:
+                cache_ttl = _coingecko_cache_duration if is_coingecko else _cache_duration
+            cache.set(cache_key, response, cache_ttl)
         
         return response
         
@@ -143,135 +223,185 @@ def _rate_limited_request(url, min_interval=1.0, timeout=10, **kwargs):
 # Database for tracking sent news
 NEWS_DB_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "news_history.db")
 
+# One connection shared by all threads; sqlite3 connections are not safe for
+# concurrent use, so every access goes through _db_lock
+_db_conn = None
+_db_lock = threading.Lock()
+
+# Send time (epoch seconds) of each recorded hash, oldest first. Loaded from
+# news_history when the connection opens and updated on every mark, so
+# duplicate checks are answered from memory without a query. Bounded; the
+# oldest entries are evicted first.
+_sent_times = OrderedDict()
+MAX_TRACKED_HASHES = 50000
+
+def _record_sent(news_hashes, sent_at):
+    """Record hashes as sent at epoch ``sent_at``. Call with _db_lock held."""
+    for news_hash in news_hashes:
+        _sent_times[news_hash] = sent_at
+        _sent_times.move_to_end(news_hash)
+    while len(_sent_times) > MAX_TRACKED_HASHES:
+        _sent_times.popitem(last=False)
+
+def _get_conn():
+    """Return the shared news history connection, opening it on first use. Call with _db_lock held."""
+    global _db_conn
+    if _db_conn is None:
+        os.makedirs(os.path.dirname(NEWS_DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(NEWS_DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-64000")
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS news_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    news_hash TEXT UNIQUE,
+                    title TEXT,
+                    source TEXT,
+                    published_time TEXT,
+                    sent_time TEXT,
+                    category TEXT,
+                    url TEXT
+                )
+            ''')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sent_time ON news_history(sent_time)")
+        _load_sent_times(conn)
+        _db_conn = conn
+    return _db_conn
+
+def _load_sent_times(conn):
+    """Fill _sent_times with the most recent rows of news_history. Call with _db_lock held."""
+    rows = conn.execute(
+        "SELECT news_hash, sent_time FROM news_history ORDER BY sent_time DESC LIMIT ?",
+        (MAX_TRACKED_HASHES,)
+    ).fetchall()
+    _sent_times.clear()
+    for news_hash, sent_time in reversed(rows):
+        try:
+            _sent_times[news_hash] = datetime.fromisoformat(sent_time).timestamp()
+        except (TypeError, ValueError):
+            continue
+
 def init_news_history_db():
-    """Initialize the news history database."""
-    os.makedirs(os.path.dirname(NEWS_DB_PATH), exist_ok=True)
-    
-    conn = sqlite3.connect(NEWS_DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS news_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            news_hash TEXT UNIQUE,
-            title TEXT,
-            source TEXT,
-            published_time TEXT,
-            sent_time TEXT,
-            category TEXT,
-            url TEXT
-        )
-    ''')
+    """
+    Initialize the news history database.
     
-    conn.commit()
-    conn.close()
+    Optional: every history function opens the database on first use, so
+    importing this module does no disk I/O.
+    """
+    with _db_lock:
+        _get_conn()
 
 def get_news_hash(title, source):
     """Generate a unique hash for news item to track duplicates."""
-    return hashlib.md5(f"{title.lower().strip()}{source}".encode()).hexdigest()
+    # Only a dedup key, so a short non-cryptographic-strength digest is enough
+    return hashlib.blake2b(f"{title.lower().strip()}|{source}".encode(), digest_size=8).hexdigest()
 
 def is_news_already_sent(news_hash, hours_back=6):
     """Check if news was already sent in the last N hours."""
     try:
-        conn = sqlite3.connect(NEWS_DB_PATH)
-        cursor = conn.cursor()
-        
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
-        
-        cursor.execute('''
-            SELECT COUNT(*) FROM news_history 
-            WHERE news_hash = ? AND sent_time > ?
-        ''', (news_hash, cutoff_time.isoformat()))
-        
-        count = cursor.fetchone()[0]
-        conn.close()
-        
-        return count > 0
+        cutoff = time.time() - hours_back * 3600
+        with _db_lock:
+            _get_conn()
+            return _sent_times.get(news_hash, 0.0) > cutoff
     except Exception as e:
         logger.error(f"Error checking news history: {e}")
         return False
 
+def filter_unseen_hashes(hashes, hours_back=6):
+    """
+    Return the subset of ``hashes`` not sent in the last N hours.
+    """
+    hashes = set(hashes)
+    if not hashes:
+        return hashes
+    try:
+        cutoff = time.time() - hours_back * 3600
+        with _db_lock:
+            _get_conn()
+            return {h for h in hashes if _sent_times.get(h, 0.0) <= cutoff}
+    except Exception as e:
+        logger.error(f"Error checking news history: {e}")
+        return hashes
+
 def mark_news_as_sent(news_hash, title, source, published_time, category, url=""):
     """Mark news as sent to prevent future duplicates."""
     try:
-        conn = sqlite3.connect(NEWS_DB_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO news_history 
-            (news_hash, title, source, published_time, sent_time, category, url)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (news_hash, title, source, published_time, datetime.now().isoformat(), category, url))
-        
-        conn.commit()
-        conn.close()
+        sent_time = datetime.now()
+        with _db_lock:
+            conn = _get_conn()
+            with conn:
+                conn.execute('''
+                    INSERT INTO news_history
+                    (news_hash, title, source, published_time, sent_time, category, url)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(news_hash) DO UPDATE SET sent_time = excluded.sent_time
+                ''', (news_hash, title, source, published_time, sent_time.isoformat(), category, url))
+            _record_sent((news_hash,), sent_time.timestamp())
+    except Exception as e:
+        logger.error(f"Error marking news as sent: {e}")
+
+def mark_news_batch_as_sent(rows):
+    """
+    Mark several news items as sent in one transaction.
+    
+    Args:
+        rows (list): (news_hash, title, source, published_time, category, url) tuples
+    """
+    if not rows:
+        return
+    try:
+        sent_time = datetime.now()
+        sent_iso = sent_time.isoformat()
+        with _db_lock:
+            conn = _get_conn()
+            with conn:
+                conn.executemany('''
+                    INSERT INTO news_history
+                    (news_hash, title, source, published_time, sent_time, category, url)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(news_hash) DO UPDATE SET sent_time = excluded.sent_time
+                ''', [(h, t, s, p, sent_iso, c, u) for h, t, s, p, c, u in rows])
+            _record_sent((row[0] for row in rows), sent_time.timestamp())
     except Exception as e:
         logger.error(f"Error marking news as sent: {e}")
 
 def cleanup_old_news_history(days_back=7):
     """Clean up old news history to prevent database bloat."""
     try:
-        conn = sqlite3.connect(NEWS_DB_PATH)
-        cursor = conn.cursor()
-        
         cutoff_time = datetime.now() - timedelta(days=days_back)
         
-        cursor.execute('''
-            DELETE FROM news_history WHERE sent_time < ?
-        ''', (cutoff_time.isoformat(),))
-        
-        conn.commit()
-        conn.close()
+        with _db_lock:
+            conn = _get_conn()
+            with conn:
+                conn.execute('''
+                    DELETE FROM news_history WHERE sent_time < ?
+                ''', (cutoff_time.isoformat(),))
+            # Drop the pruned hashes from memory as well; oldest come first
+            cutoff = cutoff_time.timestamp()
+            while _sent_times and next(iter(_sent_times.values())) < cutoff:
+                _sent_times.popitem(last=False)
     except Exception as e:
         logger.error(f"Error cleaning up news history: {e}")
 
 def get_hours_ago(published_time_str):
-    """Calculate accurate hours ago from published time string."""
-    if not published_time_str or published_time_str.strip() == "":
+    """
+    Calculate accurate hours ago from a published time.
+    
+    Args:
+        published_time_str (str or time.struct_time): Feed date string, or
+            feedparser's parsed (UTC) struct_time
+    """
+    if not published_time_str or (isinstance(published_time_str, str) and not published_time_str.strip()):
         return "recent"
     
     try:
-        # Parse various date formats commonly found in RSS feeds
-        if "GMT" in published_time_str or "UTC" in published_time_str:
-            clean_time = published_time_str.replace("GMT", "").replace("UTC", "").strip()
-            pub_time = datetime.strptime(clean_time, "%a, %d %b %Y %H:%M:%S")
-        elif published_time_str.count(',') == 1 and any(month in published_time_str for month in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']):
-            pub_time = datetime.strptime(published_time_str.strip(), "%a, %d %b %Y %H:%M:%S")
-        elif "T" in published_time_str:
-            if published_time_str.endswith('Z'):
-                pub_time = datetime.strptime(published_time_str[:-1], "%Y-%m-%dT%H:%M:%S")
-            elif '+' in published_time_str or '-' in published_time_str[-6:]:
-                if '+' in published_time_str:
-                    pub_time = datetime.strptime(published_time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
-                else:
-                    parts = published_time_str.rsplit('-', 1)
-                    if len(parts) == 2 and len(parts[1]) in [4, 5]:
-                        pub_time = datetime.strptime(parts[0], "%Y-%m-%dT%H:%M:%S")
-                    else:
-                        pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%dT%H:%M:%S")
-            else:
-                pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%dT%H:%M:%S")
-        elif published_time_str.count('-') == 2 and published_time_str.count(':') == 2:
-            pub_time = datetime.strptime(published_time_str[:19], "%Y-%m-%d %H:%M:%S")
-        else:
-            formats_to_try = [
-                "%Y-%m-%d %H:%M:%S",
-                "%d %b %Y %H:%M:%S",
-                "%d/%m/%Y %H:%M:%S",
-                "%m/%d/%Y %H:%M:%S",
-                "%Y/%m/%d %H:%M:%S"
-            ]
-            pub_time = None
-            for fmt in formats_to_try:
-                try:
-                    pub_time = datetime.strptime(published_time_str.strip()[:19], fmt)
-                    break
-                except ValueError:
-                    continue
-            
-            if pub_time is None:
-                logger.debug(f"Could not parse time format: '{published_time_str}'")
-                return "recent"
+        pub_time = parse_feed_datetime(published_time_str)
+        if pub_time is None:
+            logger.debug(f"Could not parse time format: '{published_time_str}'")
+            return "recent"
         
         # Calculate time difference
         now = datetime.now()
@@ -307,6 +437,60 @@ def get_hours_ago(published_time_str):
         logger.debug(f"Error parsing time '{published_time_str}': {e}")
         return "recent"
 
+# Source credibility weights used by calculate_news_importance_score
+SOURCE_WEIGHTS = {
+    'Prothom Alo': 10, 'The Daily Star': 9, 'BDNews24': 8, 'Dhaka Tribune': 7,
+    'Financial Express': 8, 'New Age': 6, 'Kaler Kantho': 6,
+    'BBC': 10, 'Reuters': 10, 'CNN': 8, 'Al Jazeera': 8, 'Associated Press': 9,
+    'The Guardian': 8, 'NBC News': 7, 'Sky News': 7, 'New York Post': 6,
+    'TechCrunch': 10, 'The Verge': 9, 'Ars Technica': 8, 'Wired': 8,
+    'VentureBeat': 7, 'Engadget': 7, 'ZDNet': 6, 'Mashable': 6,
+    'ESPN': 10, 'BBC Sport': 9, 'Sports Illustrated': 8, 'Yahoo Sports': 7,
+    'Fox Sports': 7, 'CBS Sports': 7, 'Sky Sports': 8,
+    'Cointelegraph': 8, 'CoinDesk': 9, 'Decrypt': 7, 'The Block': 8,
+    'Bitcoin Magazine': 7, 'CryptoSlate': 6, 'NewsBTC': 6,
+    'MarketWatch': 8, 'Yahoo Finance': 7, 'Bloomberg': 9, 'CNBC': 8
+}
+
+# Breaking news keywords (each distinct one found adds 5)
+_BREAKING_KEYWORDS = frozenset(['breaking', 'urgent', 'alert', 'emergency', 'crisis', 'live',
+                                'developing', 'update', 'latest', 'just in', 'confirmed',
+                                'exclusive', 'major', 'significant', 'important', 'critical'])
+
+# High-impact keyword groups by category and the score each group adds once
+_IMPACT_KEYWORDS = (
+    (('death', 'killed', 'murder', 'accident', 'disaster',
+      'earthquake', 'flood', 'fire', 'explosion', 'crash'), 8),
+    (('election', 'government', 'minister', 'president',
+      'prime minister', 'parliament', 'court', 'verdict'), 7),
+    (('bitcoin', 'crypto', 'blockchain', 'ethereum',
+      'market crash', 'surge', 'rally', 'all-time high'), 6),
+    (('war', 'conflict', 'attack', 'bombing', 'invasion',
+      'ceasefire', 'peace', 'treaty'), 9),
+    (('ai', 'artificial intelligence', 'chatgpt', 'openai',
+      'launch', 'release', 'breakthrough', 'innovation'), 5),
+)
+
+# Keyword -> (group index, score); breaking keywords use group -1
+_KEYWORD_GROUPS = {keyword: (-1, 5) for keyword in _BREAKING_KEYWORDS}
+_KEYWORD_GROUPS.update(
+    (keyword, (group, weight))
+    for group, (keywords, weight) in enumerate(_IMPACT_KEYWORDS)
+    for keyword in keywords
+)
+
+# One pass finds every keyword occurrence in a title. The lookahead lets
+# matches overlap ("market crash" also contains "crash"), so results equal
+# per-keyword substring tests; no keyword is a prefix of another, so the
+# alternation cannot hide one behind a longer match at the same position.
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(_KEYWORD_GROUPS, key=len, reverse=True))) + '))'
+)
+
+# Title clean-up patterns
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
 def calculate_news_importance_score(entry, source_name, feed_position):
     """Calculate importance score for news entry based on multiple factors."""
     score = 0
@@ -317,152 +501,219 @@ def calculate_news_importance_score(entry, source_name, feed_position):
     score += position_score
     
     # Source credibility weight
-    source_weights = {
-        'Prothom Alo': 10, 'The Daily Star': 9, 'BDNews24': 8, 'Dhaka Tribune': 7,
-        'Financial Express': 8, 'New Age': 6, 'Kaler Kantho': 6,
-        'BBC': 10, 'Reuters': 10, 'CNN': 8, 'Al Jazeera': 8, 'Associated Press': 9,
-        'The Guardian': 8, 'NBC News': 7, 'Sky News': 7, 'New York Post': 6,
-        'TechCrunch': 10, 'The Verge': 9, 'Ars Technica': 8, 'Wired': 8,
-        'VentureBeat': 7, 'Engadget': 7, 'ZDNet': 6, 'Mashable': 6,
-        'ESPN': 10, 'BBC Sport': 9, 'Sports Illustrated': 8, 'Yahoo Sports': 7,
-        'Fox Sports': 7, 'CBS Sports': 7, 'Sky Sports': 8,
-        'Cointelegraph': 8, 'CoinDesk': 9, 'Decrypt': 7, 'The Block': 8,
-        'Bitcoin Magazine': 7, 'CryptoSlate': 6, 'NewsBTC': 6,
-        'MarketWatch': 8, 'Yahoo Finance': 7, 'Bloomberg': 9, 'CNBC': 8
-    }
-    score += source_weights.get(source_name, 5)
+    score += SOURCE_WEIGHTS.get(source_name, 5)
     
-    # Breaking news keywords
-    breaking_keywords = ['breaking', 'urgent', 'alert', 'emergency', 'crisis', 'live', 
-                        'developing', 'update', 'latest', 'just in', 'confirmed',
-                        'exclusive', 'major', 'significant', 'important', 'critical']
-    for keyword in breaking_keywords:
-        if keyword in title:
-            score += 5
+    # Breaking news keywords add 5 each; high-impact categories add their
+    # weight once however many of their keywords appear
+    matched = set(_KEYWORD_RE.findall(title))
+    groups = {}
+    for keyword in matched:
+        group, weight = _KEYWORD_GROUPS[keyword]
+        if group < 0:
+            score += weight
+        else:
+            groups[group] = weight
+    score += sum(groups.values())
     
-    # High-impact keywords by category
-    if any(word in title for word in ['death', 'killed', 'murder', 'accident', 'disaster', 
-                                     'earthquake', 'flood', 'fire', 'explosion', 'crash']):
-        score += 8
+    return score
+
+# Feed elements read by _parse_feed_entries, by local name (namespace dropped)
+_FEED_ITEM_TAGS = frozenset(('item', 'entry'))
+_FEED_DATE_TAGS = ('pubDate', 'published', 'updated', 'date')
+
+def _local_name(tag):
+    """Strip the '{namespace}' prefix ElementTree puts on tag names."""
+    return tag.rpartition('}')[2]
+
+def _parse_feed_entries(body, limit):
+    """
+    Parse the first ``limit`` items of an RSS or Atom feed.
     
-    if any(word in title for word in ['election', 'government', 'minister', 'president', 
-                                     'prime minister', 'parliament', 'court', 'verdict']):
-        score += 7
+    Well-formed feeds are streamed with ElementTree's iterparse, which stops
+    after ``limit`` items and frees each one once read; anything it cannot
+    parse is handed to feedparser, which tolerates broken markup.
     
-    if any(word in title for word in ['bitcoin', 'crypto', 'blockchain', 'ethereum', 
-                                     'market crash', 'surge', 'rally', 'all-time high']):
-        score += 6
+    Returns:
+        list: {'title', 'link', 'published'} dicts in feed order
+    """
+    entries = []
+    try:
+        for _, elem in ET.iterparse(io.BytesIO(body), events=('end',)):
+            if _local_name(elem.tag) not in _FEED_ITEM_TAGS:
+                continue
+            fields = {}
+            for child in elem:
+                name = _local_name(child.tag)
+                if name == 'link':
+                    # Atom puts the URL in href; prefer the alternate link
+                    if child.get('href') is not None:
+                        if 'link' not in fields or child.get('rel', 'alternate') == 'alternate':
+                            fields['link'] = child.get('href')
+                    elif child.text:
+                        fields['link'] = child.text.strip()
+                elif name not in fields:
+                    fields[name] = child.text or ''
+            entries.append({
+                'title': fields.get('title', ''),
+                'link': fields.get('link', ''),
+                'published': next((fields[tag].strip() for tag in _FEED_DATE_TAGS if fields.get(tag)), '')
+            })
+            elem.clear()
+            if len(entries) >= limit:
+                break
+        return entries
+    except ET.ParseError:
+        pass
     
-    if any(word in title for word in ['war', 'conflict', 'attack', 'bombing', 'invasion', 
-                                     'ceasefire', 'peace', 'treaty']):
-        score += 9
+    # feedparser has already parsed the dates; keep its struct_time so the
+    # age is computed from it directly instead of re-parsing a string
+    feed = feedparser.parse(body)
+    entries = []
+    for entry in feed.entries[:limit]:
+        entries.append({
+            'title': entry.get('title', ''),
+            'link': entry.get('link', ''),
+            'published': entry.get('published') or entry.get('updated') or '',
+            'published_parsed': entry.get('published_parsed') or entry.get('updated_parsed')
+        })
+    return entries
+
+def _fetch_source_entries(source_name, rss_url, limit, category):
+    """
+    Fetch one RSS source and return its top scored entries.
     
-    if any(word in title for word in ['ai', 'artificial intelligence', 'chatgpt', 'openai',
-                                     'launch', 'release', 'breakthrough', 'innovation']):
-        score += 5
+    The cleaned, scored entries are cached for the RSS cache duration so a
+    refresh within that window skips parsing and scoring as well as the
+    download.
+    """
+    cache_key = (source_name, rss_url, limit, category)
+    cached_entries = _feed_entries_cache.get(cache_key)
+    if cached_entries is not None:
+        return list(cached_entries)
     
-    return score
+    entries = []
+    try:
+        logger.debug(f"Fetching breaking news from {source_name}")
+        response = _rate_limited_request(
+            rss_url, 
+            min_interval=2.0,
+            timeout=15,
+            cache_ttl=_rss_cache_duration
+        )
+        response.raise_for_status()
+        feed_entries = _parse_feed_entries(response.content, limit)
+        
+        if not feed_entries:
+            logger.debug(f"No entries found in feed from {source_name}")
+            return entries
+            
+        logger.debug(f"Successfully fetched {len(feed_entries)} entries from {source_name}")
+        
+        for position, entry in enumerate(feed_entries):
+            try:
+                title = entry.get('title', '').strip()
+                if not title or len(title) < 5:
+                    continue
+                    
+                # Clean HTML tags
+                title = _HTML_TAG_RE.sub('', title)
+                title = _WS_RE.sub(' ', title)
+                title = title.strip()
+                
+                link = entry.get('link', '')
+                pub_time = entry.get('published', '')
+                
+                time_ago = get_hours_ago(entry.get('published_parsed') or pub_time)
+                if time_ago == "Unknown":
+                    time_ago = "recent"
+                
+                news_hash = get_news_hash(title, source_name)
+                importance_score = calculate_news_importance_score(entry, source_name, position)
+                total_score = importance_score + 50
+                
+                entry_data = {
+                    'title': title,
+                    'link': link,
+                    'source': source_name,
+                    'published': pub_time,
+                    'time_ago': time_ago,
+                    'hash': news_hash,
+                    'category': category,
+                    'importance_score': importance_score,
+                    'total_score': total_score,
+                    'hours_ago': 0
+                }
+                entries.append(entry_data)
+                if len(entries) >= 3:
+                    break
+                    
+            except Exception as e:
+                logger.debug(f"Error processing entry from {source_name}: {e}")
+                continue
+        
+        _feed_entries_cache.set(cache_key, tuple(entries), _rss_cache_duration)
+                
+    except Exception as e:
+        logger.warning(f"Error fetching from {source_name}: {e}")
+    return entries
+
+def _fetch_domain_sources(domain_sources, limit, category):
+    """Fetch sources that share a domain one after another to respect its rate limit."""
+    return {
+        source_name: _fetch_source_entries(source_name, rss_url, limit, category)
+        for source_name, rss_url in domain_sources
+    }
 
 def fetch_breaking_news_rss(sources, limit=25, category="news", target_count=4):
     """Fetch breaking news from RSS sources."""
-    all_entries = []
-    successful_sources = 0
-    
+    # Fetch different domains concurrently; sources on the same domain stay
+    # sequential so the per-domain minimum interval still applies
+    by_domain = {}
     for source_name, rss_url in sources.items():
-        try:
-            logger.debug(f"Fetching breaking news from {source_name}")
-            response = _rate_limited_request(
-                rss_url, 
-                min_interval=2.0,
-                timeout=15
-            )
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
-            
-            if not feed.entries:
-                logger.debug(f"No entries found in feed from {source_name}")
-                continue
-                
-            successful_sources += 1
-            logger.debug(f"Successfully fetched {len(feed.entries)} entries from {source_name}")
-            
-            source_articles = 0
-            for position, entry in enumerate(feed.entries[:limit]):
-                try:
-                    title = entry.get('title', '').strip()
-                    if not title or len(title) < 5:
-                        continue
-                        
-                    # Clean HTML tags
-                    title = re.sub(r'<[^>]+>', '', title)
-                    title = re.sub(r'\s+', ' ', title)
-                    title = title.strip()
-                    
-                    link = entry.get('link', '')
-                    
-                    # Get published time
-                    pub_time = ""
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        pub_time = time.strftime("%a, %d %b %Y %H:%M:%S GMT", entry.published_parsed)
-                    elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                        pub_time = time.strftime("%a, %d %b %Y %H:%M:%S GMT", entry.updated_parsed)
-                    elif hasattr(entry, 'published') and entry.published:
-                        pub_time = entry.published
-                    elif hasattr(entry, 'updated') and entry.updated:
-                        pub_time = entry.updated
-                    
-                    time_ago = get_hours_ago(pub_time)
-                    if time_ago == "Unknown":
-                        time_ago = "recent"
-                    
-                    news_hash = get_news_hash(title, source_name)
-                    importance_score = calculate_news_importance_score(entry, source_name, position)
-                    total_score = importance_score + 50
-                    
-                    entry_data = {
-                        'title': title,
-                        'link': link,
-                        'source': source_name,
-                        'published': pub_time,
-                        'time_ago': time_ago,
-                        'hash': news_hash,
-                        'category': category,
-                        'importance_score': importance_score,
-                        'total_score': total_score,
-                        'hours_ago': 0
-                    }
-                    all_entries.append(entry_data)
-                    source_articles += 1
-                    if source_articles >= 3:
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"Error processing entry from {source_name}: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.warning(f"Error fetching from {source_name}: {e}")
-            continue
+        by_domain.setdefault(_url_domain(rss_url), []).append((source_name, rss_url))
+    
+    entries_by_source = {}
+    futures = [
+        _rss_executor.submit(_fetch_domain_sources, domain_sources, limit, category)
+        for domain_sources in by_domain.values()
+    ]
+    for future in as_completed(futures):
+        entries_by_source.update(future.result())
+    
+    # Keep the configured source order so equal scores rank as before
+    all_entries = []
+    for source_name in sources:
+        all_entries.extend(entries_by_source.get(source_name, ()))
     
     # Sort by total score
     all_entries.sort(key=lambda x: x['total_score'], reverse=True)
     
-    # Select final entries with source diversity
+    # Prefer stories not sent in a recent slot; already-sent ones are only
+    # used to fill the section if there are not enough fresh ones
+    unseen = filter_unseen_hashes(e['hash'] for e in all_entries)
+    repeats = [e for e in all_entries if e['hash'] not in unseen]
+    all_entries = [e for e in all_entries if e['hash'] in unseen]
+    
+    # Select final entries with source diversity (at most 2 per source)
     final_entries = []
-    used_sources = {}
+    selected_ids = set()
+    used_sources = Counter()
     
     for entry in all_entries:
+        if len(final_entries) >= target_count:
+            break
         source = entry['source']
-        if used_sources.get(source, 0) < 2 and len(final_entries) < target_count:
+        if used_sources[source] < 2:
             final_entries.append(entry)
-            used_sources[source] = used_sources.get(source, 0) + 1
+            selected_ids.add(id(entry))
+            used_sources[source] += 1
     
-    # Fill remaining slots
-    if len(final_entries) < target_count:
-        remaining_entries = [e for e in all_entries if e not in final_entries]
-        remaining_entries.sort(key=lambda x: x['total_score'], reverse=True)
-        while len(final_entries) < target_count and remaining_entries:
-            final_entries.append(remaining_entries.pop(0))
+    # Fill remaining slots in score order, then with already-sent stories
+    for entry in chain(all_entries, repeats):
+        if len(final_entries) >= target_count:
+            break
+        if id(entry) not in selected_ids:
+            final_entries.append(entry)
     
     logger.info(f"Selected {len(final_entries)} entries for {category}")
     return final_entries
@@ -471,6 +722,7 @@ def format_news_section(section_title, entries, limit=4):
     """Format news entries to match exact output format."""
     formatted = f"\n{section_title} NEWS\n"
     count = 0
+    sent_rows = []
     
     if entries:
         entries = sorted(entries, key=lambda x: x.get('total_score', 0), reverse=True)
@@ -489,10 +741,11 @@ def format_news_section(section_title, entries, limit=4):
         count += 1
         formatted += f"{count}. {title} - {source} ({time_ago})\n"
         
-        try:
-            mark_news_as_sent(entry['hash'], title, source, entry.get('published', ''), entry.get('category', ''), entry.get('link', ''))
-        except Exception as e:
-            logger.debug(f"Error marking news as sent: {e}")
+        if entry.get('hash'):
+            sent_rows.append((entry['hash'], title, source, entry.get('published', ''), entry.get('category', ''), entry.get('link', '')))
+    
+    # Record the whole section in one transaction instead of one per item
+    mark_news_batch_as_sent(sent_rows)
     
     return formatted
 
@@ -581,14 +834,81 @@ def get_breaking_finance_news():
     entries = fetch_breaking_news_rss(finance_sources, limit=25, category="finance", target_count=4)
     return format_news_section("FINANCE", entries, limit=4)
 
+# Breaking news section builders, in digest order
+BREAKING_NEWS_FETCHERS = {
+    "local": get_breaking_local_news,
+    "global": get_breaking_global_news,
+    "tech": get_breaking_tech_news,
+    "sports": get_breaking_sports_news,
+    "finance": get_breaking_finance_news
+}
+
+def submit_breaking_news(categories=None):
+    """
+    Start building breaking news sections concurrently.
+    
+    Args:
+        categories (iterable, optional): Keys of BREAKING_NEWS_FETCHERS to
+            fetch; all of them by default
+        
+    Returns:
+        dict: Category -> Future for its formatted section. ``result()``
+        re-raises any error from that section's fetch.
+    """
+    if categories is None:
+        categories = list(BREAKING_NEWS_FETCHERS)
+    executor = ThreadPoolExecutor(max_workers=max(1, len(categories)))
+    try:
+        return {category: executor.submit(BREAKING_NEWS_FETCHERS[category]) for category in categories}
+    finally:
+        # Submitted sections keep running; the workers exit once they finish
+        executor.shutdown(wait=False)
+
+def iter_breaking_news(news_futures):
+    """
+    Wait for sections started by submit_breaking_news, one at a time.
+    
+    Yields:
+        tuple: (category, formatted section) in submission order, with ""
+        for a section that failed
+    """
+    for category, future in news_futures.items():
+        try:
+            yield category, future.result()
+        except Exception as e:
+            logger.warning(f"Error getting {category} news: {e}")
+            yield category, ""
+
+def collect_breaking_news(news_futures):
+    """
+    Wait for sections started by submit_breaking_news.
+    
+    Returns:
+        dict: Category -> formatted section, "" for a section that failed
+    """
+    return dict(iter_breaking_news(news_futures))
+
+def get_all_breaking_news(categories=None):
+    """
+    Build breaking news sections concurrently.
+    
+    Returns:
+        dict: Category -> formatted section, "" for a section that failed
+    """
+    return collect_breaking_news(submit_breaking_news(categories))
+
 # ===================== WEATHER DATA =====================
 
+# Shown when WeatherAPI is not configured or the request fails
+WEATHER_FALLBACK = "WEATHER\n27.7°C | Patchy rain nearby\nAir: Moderate (2) | UV: Minimal (0.0/11)\n"
+
+@ttl_cache(ttl=Config.WEATHER_CACHE_TTL, cache_if=lambda text: text != WEATHER_FALLBACK)
 def get_dhaka_weather():
     """Get weather in exact format."""
     try:
         api_key = Config.WEATHERAPI_KEY
         if not api_key:
-            return "WEATHER\n27.7°C | Patchy rain nearby\nAir: Moderate (2) | UV: Minimal (0.0/11)\n"
+            return WEATHER_FALLBACK
             
         url = "http://api.weatherapi.com/v1/current.json"
         params = {"key": api_key, "q": "Dhaka", "aqi": "yes"}
@@ -616,40 +936,65 @@ def get_dhaka_weather():
         
     except Exception as e:
         logger.error(f"Weather error: {e}")
-        return "WEATHER\n27.7°C | Patchy rain nearby\nAir: Moderate (2) | UV: Minimal (0.0/11)\n"
+        return WEATHER_FALLBACK
 
 # ===================== CRYPTO DATA =====================
 
+@ttl_cache(ttl=30, maxsize=64)
+def _get_json(url, params=(), min_interval=1.5, timeout=15):
+    """
+    GET a JSON API endpoint and return the decoded body.
+    
+    Decoded results are shared for 30 seconds, so the CoinGecko and
+    Fear & Greed endpoints polled by several commands are fetched and
+    parsed once per window. ``params`` is a tuple of (key, value) pairs so
+    the call is hashable. Errors are raised and not cached.
+    """
+    response = _rate_limited_request(url, min_interval=min_interval, timeout=timeout, params=params or None)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+def _get_market_overview():
+    """
+    Get the global crypto market figures shown by the digest and /cryptostats.
+    
+    Both read the same /global and Fear & Greed responses, which _get_json
+    shares between them for its cache window.
+    
+    Returns:
+        tuple: (market cap, volume, 24h market cap change %, fear & greed index)
+    """
+    data = _get_json("https://api.coingecko.com/api/v3/global")["data"]
+    
+    # Fear & Greed
+    try:
+        fear_index = _get_json("https://api.alternative.me/fng/?limit=1", min_interval=1.0, timeout=10)["data"][0]["value"]
+    except:
+        fear_index = "71"
+    
+    return (data["total_market_cap"]["usd"], data["total_volume"]["usd"],
+            data["market_cap_change_percentage_24h_usd"], fear_index)
+
+# Shown when the market figures cannot be fetched
+CRYPTO_MARKET_FALLBACK = "\nCRYPTO MARKET: SEE MORE\nMarket Cap: $3.99T (-3.85%) ▼\nVolume: $253.51B (-1.08%) ▼\nFear/Greed: 71/100 = HOLD\n"
+
+@ttl_cache(ttl=Config.CRYPTO_CACHE_TTL, cache_if=lambda text: text != CRYPTO_MARKET_FALLBACK)
 def fetch_crypto_market_with_ai():
     """Get crypto market in exact format."""
     try:
-        url = "https://api.coingecko.com/api/v3/global"
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15)
-        response.raise_for_status()
-        
-        data = response.json()["data"]
-        market_cap = data["total_market_cap"]["usd"]
-        volume = data["total_volume"]["usd"]
-        market_change = data["market_cap_change_percentage_24h_usd"]
+        market_cap, volume, market_change, fear_index = _get_market_overview()
         
-        market_cap_str = f"${market_cap/1e12:.2f}T"
-        volume_str = f"${volume/1e12:.2f}T" if volume >= 1e12 else f"${volume/1e9:.2f}B"
+        market_cap_str = _fmt_money(market_cap)
+        volume_str = _fmt_money(volume)
         
-        market_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        volume_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        
-        # Fear & Greed
-        try:
-            fear_response = _rate_limited_request("https://api.alternative.me/fng/?limit=1", min_interval=1.0, timeout=10)
-            fear_index = fear_response.json()["data"][0]["value"]
-        except:
-            fear_index = "71"
+        market_arrow = _arrow(market_change)
+        volume_arrow = _arrow(market_change)
             
         return f"\nCRYPTO MARKET: SEE MORE\nMarket Cap: {market_cap_str} ({market_change:+.2f}%) {market_arrow}\nVolume: {volume_str} ({market_change:+.2f}%) {volume_arrow}\nFear/Greed: {fear_index}/100 = HOLD\n"
         
     except Exception as e:
         logger.error(f"Crypto error: {e}")
-        return "\nCRYPTO MARKET: SEE MORE\nMarket Cap: $3.99T (-3.85%) ▼\nVolume: $253.51B (-1.08%) ▼\nFear/Greed: 71/100 = HOLD\n"
+        return CRYPTO_MARKET_FALLBACK
 
 def format_crypto_price(price):
     """Format cryptocurrency price with appropriate decimal places."""
@@ -664,8 +1009,115 @@ def format_crypto_price(price):
     else:
         return f"${price:.8f}"
 
+# Direction arrows indexed by the sign of a change: (change > 0) - (change < 0)
+_ARROWS = {1: "▲", -1: "▼", 0: "→"}
+
+def _arrow(change):
+    """Return the ▲/▼/→ arrow for the sign of a change."""
+    return _ARROWS[(change > 0) - (change < 0)]
+
+# Money magnitude suffixes keyed by power of ten
+_MONEY_UNITS = {12: (1e12, "T"), 9: (1e9, "B"), 6: (1e6, "M")}
+
+def _fmt_money(value, decimals=2):
+    """Format a dollar amount with a T/B/M suffix, e.g. $2.41T or $85.30B."""
+    if value < 1e6:
+        return f"${value:.0f}"
+    divisor, suffix = _MONEY_UNITS[min(int(math.log10(value)) // 3 * 3, 12)]
+    return f"${value / divisor:.{decimals}f}{suffix}"
+
+# Symbol -> (id, name, SYMBOL) map built from /coins/list. Symbol to id
+# mappings are effectively static, so the map is persisted to disk for a day
+# and loaded once per process
+_coin_ids = None
+_coin_ids_lock = threading.Lock()
+
+# After a failed build, lookups go to the search API until the build is
+# retried this many seconds later
+COIN_ID_MAP_RETRY_SECONDS = 300
+_coin_ids_retry_at = 0.0
+
+def _build_coin_id_map():
+    """
+    Build the symbol -> coin id map from CoinGecko's full coin list.
+    
+    Many symbols are shared by several coins; those are resolved to the
+    largest coin by market cap when it is in the top 250, and otherwise left
+    out so lookups fall back to the search API, which ranks by market cap.
+    """
+    # The full list is several MB and only read here, so it is fetched
+    # directly rather than kept in the shared response caches
+    coins_url = "https://api.coingecko.com/api/v3/coins/list"
+    _wait_for_domain(_url_domain(coins_url), 1.5)
+    response = _SESSION.get(coins_url, timeout=30, headers={
+        'User-Agent': 'ChoyNewsBot/2.0 (Telegram Bot)',
+        'Accept': 'application/json',
+        'Accept-Encoding': ACCEPT_ENCODING
+    })
+    response.raise_for_status()
+    coins = _json_loads(response.content)
+    top_markets = _get_json(
+        "https://api.coingecko.com/api/v3/coins/markets",
+        (("vs_currency", "usd"), ("order", "market_cap_desc"), ("per_page", "250"), ("page", "1"))
+    )
+    
+    by_symbol = {}
+    ambiguous = set()
+    for coin in coins:
+        symbol = (coin.get("symbol") or "").lower()
+        if not symbol or not coin.get("id"):
+            continue
+        if symbol in by_symbol:
+            ambiguous.add(symbol)
+        else:
+            by_symbol[symbol] = [coin["id"], coin.get("name"), symbol.upper()]
+    for symbol in ambiguous:
+        del by_symbol[symbol]
+    
+    # Markets come largest first, so the first coin seen for a symbol wins
+    ranked = set()
+    for coin in top_markets:
+        symbol = (coin.get("symbol") or "").lower()
+        if symbol and symbol not in ranked:
+            ranked.add(symbol)
+            by_symbol[symbol] = [coin["id"], coin.get("name"), symbol.upper()]
+    return by_symbol
+
+def _get_coin_id_map():
+    """
+    Return the symbol -> coin id map, loading or rebuilding it on first use.
+    
+    An empty map is returned while a failed build waits to be retried.
+    """
+    global _coin_ids, _coin_ids_retry_at
+    if _coin_ids is not None:
+        return _coin_ids
+    if time.monotonic() < _coin_ids_retry_at:
+        return {}
+    with _coin_ids_lock:
+        if _coin_ids is None and time.monotonic() >= _coin_ids_retry_at:
+            coin_ids = get_cached_coingecko_ids()
+            if coin_ids is None:
+                try:
+                    coin_ids = _build_coin_id_map()
+                    cache_coingecko_ids(coin_ids)
+                except Exception as e:
+                    logger.debug(f"Error building CoinGecko coin id map: {e}")
+                    _coin_ids_retry_at = time.monotonic() + COIN_ID_MAP_RETRY_SECONDS
+                    return {}
+            _coin_ids = {symbol: tuple(entry) for symbol, entry in coin_ids.items()}
+    return _coin_ids if _coin_ids is not None else {}
+
 def get_coingecko_coin_id(symbol):
-    """Get CoinGecko coin ID from symbol using their search API."""
+    """
+    Get CoinGecko coin ID from symbol.
+    
+    Resolved from the cached coin list when the symbol maps to a single
+    coin (or a top-250 one); otherwise CoinGecko's search API is used.
+    """
+    coin = _get_coin_id_map().get(symbol.lower())
+    if coin is not None:
+        return coin
     try:
         search_url = f"https://api.coingecko.com/api/v3/search"
         params = {"query": symbol.lower()}
@@ -673,13 +1125,18 @@ def get_coingecko_coin_id(symbol):
         response = _rate_limited_request(search_url, min_interval=1.0, timeout=15, params=params)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         coins = data.get("coins", [])
         
         # Look for exact symbol match first
         for coin in coins:
             if coin.get("symbol", "").lower() == symbol.lower():
-                return coin.get("id"), coin.get("name"), coin.get("symbol", "").upper()
+                result = coin.get("id"), coin.get("name"), coin.get("symbol", "").upper()
+                # Exact matches are remembered for the life of the process
+                with _coin_ids_lock:
+                    if _coin_ids is not None:
+                        _coin_ids[symbol.lower()] = result
+                return result
         
         # If no exact match, try first result
         if coins:
@@ -692,112 +1149,115 @@ def get_coingecko_coin_id(symbol):
         logger.debug(f"Error searching for coin {symbol}: {e}")
         return None, None, None
 
-def get_individual_crypto_stats(symbol):
-    """Get detailed crypto stats with dynamic CoinGecko lookup for any coin."""
-    try:
-        coin_id, coin_name, coin_symbol = get_coingecko_coin_id(symbol)
-        
-        if not coin_id:
-            return None
-        
-        # Fetch detailed coin data
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
-        params = {
-            "localization": "false",
-            "tickers": "false",
-            "market_data": "true",
-            "community_data": "false",
-            "developer_data": "false"
-        }
-        
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        market_data = data.get("market_data", {})
-        
-        # Extract key metrics
-        name = coin_name or data.get("name", symbol.upper())
-        current_price = market_data.get("current_price", {}).get("usd", 0)
-        price_change_24h = market_data.get("price_change_percentage_24h", 0) or 0
-        market_cap = market_data.get("market_cap", {}).get("usd", 0)
-        volume_24h = market_data.get("total_volume", {}).get("usd", 0)
-        market_cap_rank = market_data.get("market_cap_rank", "N/A")
-        
-        # Get 52-week high and low
-        ath = market_data.get("ath", {}).get("usd", 0)
-        atl = market_data.get("atl", {}).get("usd", 0)
-        
-        week_52_high = ath if ath else current_price * 1.5
-        week_52_low = atl if atl else current_price * 0.5
-        
-        # Format price
-        price_str = format_crypto_price(current_price)
-        
-        # Format market cap
-        if market_cap >= 1e9:
-            mcap_str = f"${market_cap/1e9:.1f}B"
-        elif market_cap >= 1e6:
-            mcap_str = f"${market_cap/1e6:.1f}M"
-        else:
-            mcap_str = f"${market_cap:.0f}"
-        
-        # Format volume
-        if volume_24h >= 1e9:
-            vol_str = f"${volume_24h/1e9:.1f}B"
-        elif volume_24h >= 1e6:
-            vol_str = f"${volume_24h/1e6:.1f}M"
-        else:
-            vol_str = f"${volume_24h:.0f}"
-        
-        # Direction arrows
-        price_arrow = "▲" if price_change_24h > 0 else "▼" if price_change_24h < 0 else "→"
-        volume_change = 1.4
-        volume_arrow = "▲" if volume_change > 0 else "▼" if volume_change < 0 else "→"
-        
-        # Format rank
-        rank_str = f"(#{market_cap_rank})" if market_cap_rank != "N/A" else ""
-        
-        # Format 52-week range
-        if week_52_high >= 1:
-            high_52w_str = f"${week_52_high:.3f}"
-        else:
-            high_52w_str = f"${week_52_high:.6f}"
-            
-        if week_52_low >= 1:
-            low_52w_str = f"${week_52_low:.3f}"
-        else:
-            low_52w_str = f"${week_52_low:.6f}"
+def get_multi_coin_stats(symbols):
+    """
+    Get market data for several coins with one CoinGecko request.
+    
+    Symbols are resolved to CoinGecko ids, then a single /coins/markets call
+    returns price, 24h change, market cap, volume, rank, 24h high/low and
+    all-time high/low for all of them.
+    
+    Args:
+        symbols (iterable): Coin symbols, e.g. ["btc", "eth"]
+        
+    Returns:
+        dict: Symbol (as given) -> /coins/markets entry; symbols that could
+        not be resolved are left out
+    """
+    coin_ids = {}
+    for symbol in symbols:
+        coin_id, _, _ = get_coingecko_coin_id(symbol)
+        if coin_id:
+            coin_ids[symbol] = coin_id
+    if not coin_ids:
+        return {}
+    
+    params = (
+        ("vs_currency", "usd"),
+        ("ids", ",".join(sorted(set(coin_ids.values())))),
+        ("sparkline", "false")
+    )
+    markets = _get_json("https://api.coingecko.com/api/v3/coins/markets", params)
+    by_id = {coin["id"]: coin for coin in markets}
+    return {symbol: by_id[coin_id] for symbol, coin_id in coin_ids.items() if coin_id in by_id}
+
+@ttl_cache(ttl=Config.CRYPTO_CACHE_TTL, maxsize=256, cache_if=lambda message: message is not None)
+def _format_crypto_stats(symbol):
+    """
+    Format the /<coin>stats message for a coin.
+    
+    Returns None for an unknown symbol. CoinGecko errors are raised, so a
+    failed lookup is not cached; neither is an unknown symbol, since the
+    symbol search can fail quietly.
+    """
+    coin = get_multi_coin_stats([symbol]).get(symbol)
+    
+    if not coin:
+        return None
+    
+    # Extract key metrics
+    name = coin.get("name") or symbol.upper()
+    current_price = coin.get("current_price") or 0
+    price_change_24h = coin.get("price_change_percentage_24h") or 0
+    market_cap = coin.get("market_cap") or 0
+    volume_24h = coin.get("total_volume") or 0
+    market_cap_rank = coin.get("market_cap_rank") or "N/A"
+    
+    # Get 52-week high and low
+    ath = coin.get("ath") or 0
+    atl = coin.get("atl") or 0
+    
+    week_52_high = ath if ath else current_price * 1.5
+    week_52_low = atl if atl else current_price * 0.5
+    
+    # Format price
+    price_str = format_crypto_price(current_price)
+    
+    # Format market cap and volume
+    mcap_str = _fmt_money(market_cap)
+    vol_str = _fmt_money(volume_24h)
+    
+    # Direction arrows
+    price_arrow = _arrow(price_change_24h)
+    volume_change = 1.4
+    volume_arrow = _arrow(volume_change)
+    
+    # Format rank
+    rank_str = f"(#{market_cap_rank})" if market_cap_rank != "N/A" else ""
+    
+    # Format 52-week range
+    if week_52_high >= 1:
+        high_52w_str = f"${week_52_high:.3f}"
+    else:
+        high_52w_str = f"${week_52_high:.6f}"
         
-        # Build the formatted message
-        stats_message = f"""{symbol.upper()} ({name})
+    if week_52_low >= 1:
+        low_52w_str = f"${week_52_low:.3f}"
+    else:
+        low_52w_str = f"${week_52_low:.6f}"
+    
+    # Build the formatted message
+    stats_message = f"""{symbol.upper()} ({name})
 🪙 Price: {price_str} ({price_change_24h:+.1f}%) {price_arrow}
 📊 24h Volume: {vol_str} ({volume_change:+.1f}%) {volume_arrow}
 💰 Market Cap: {mcap_str} {rank_str}
 
 📈 Range (52W): {low_52w_str} - {high_52w_str}"""
-        
-        return stats_message
-        
+    
+    return stats_message
+
+def get_individual_crypto_stats(symbol):
+    """Get detailed crypto stats with dynamic CoinGecko lookup for any coin."""
+    try:
+        return _format_crypto_stats(symbol)
     except Exception as e:
         logger.error(f"Error fetching {symbol} stats: {e}")
         return f"Sorry, I couldn't get detailed stats for {symbol.upper()}. Please try again later."
 
-def get_individual_crypto_ai_analysis(coin_data):
-    """Get AI analysis for individual cryptocurrency."""
-    try:
-        api_key = Config.DEEPSEEK_API
-        if not api_key:
-            return "AI analysis unavailable."
-        
-        prompt = f"""Analyze {coin_data['name']} ({coin_data['symbol']}):
-
-Current Price: ${coin_data['price']:.4f}
-24h Change: {coin_data['change_24h']:+.2f}%
-Market Cap: ${coin_data['market_cap']/1e9:.2f}B
-24h Volume: ${coin_data['volume']/1e9:.2f}B
-24h High: ${coin_data['high_24h']:.4f}
-24h Low: ${coin_data['low_24h']:.4f}
+# Format instructions for the per-coin analysis. They are sent as a fixed
+# system message ahead of the coin's numbers so every request shares the same
+# prompt prefix, which DeepSeek's automatic context cache can reuse.
+_CRYPTO_ANALYSIS_SYSTEM_PROMPT = """You are a cryptocurrency market analyst. Analyze the cryptocurrency described by the user.
 
 Provide analysis in EXACTLY this format:
 
@@ -812,121 +1272,187 @@ Technicals:
 Forecast (Next 24h): [Single paragraph prediction with specific price targets and reasoning]  
 
 Prediction (Next 24hr): 🟢 BUY / 🟠 HOLD / 🔴 SELL (with optional brief reason)"""
+_CRYPTO_ANALYSIS_SYSTEM_MESSAGE = {"role": "system", "content": _CRYPTO_ANALYSIS_SYSTEM_PROMPT}
 
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
+# Per-coin user message; market cap and volume are passed in billions
+_CRYPTO_ANALYSIS_PROMPT = """Analyze {name} ({symbol}):
+
+Current Price: ${price:.4f}
+24h Change: {change_24h:+.2f}%
+Market Cap: ${market_cap_b:.2f}B
+24h Volume: ${volume_b:.2f}B
+24h High: ${high_24h:.4f}
+24h Low: ${low_24h:.4f}"""
+
+# Request settings shared by every analysis; only the messages change
+_CRYPTO_ANALYSIS_PAYLOAD = {
+    "model": "deepseek-chat",
+    "max_tokens": 300,
+    "temperature": 0.7,
+    "stream": True
+}
+
+def _iter_completion_chunks(response):
+    """
+    Yield the text of a streamed chat completion as it arrives.
+    
+    The body is server-sent events: ``data: {json}`` lines carrying
+    ``choices[0].delta.content``, keep-alive comments, and a final
+    ``data: [DONE]``. Lines are handled as bytes since the event stream is
+    UTF-8 but usually declares no charset.
+    """
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = _json_loads(data).get("choices")
+        if choices:
+            content = choices[0].get("delta", {}).get("content")
+            if content:
+                yield content
+
+# Recent analyses keyed by coin and rounded market state, so repeat requests
+# for the same coin within a couple of minutes skip the DeepSeek call
+_ai_analysis_cache = TTLCache(maxsize=256)
+AI_ANALYSIS_CACHE_TTL = 120
+
+# Retries for an analysis request rejected as rate limited or overloaded
+DEEPSEEK_MAX_RETRIES = 2
+DEEPSEEK_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEEPSEEK_MAX_RETRY_WAIT = 5.0
+
+def _get_retry_delay(response, default):
+    """Seconds to wait before retrying: the Retry-After header if given, capped."""
+    try:
+        delay = float(response.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        delay = default
+    return min(max(delay, 0.0), DEEPSEEK_MAX_RETRY_WAIT)
+
+def get_individual_crypto_ai_analysis(coin_data):
+    """
+    Get AI analysis for individual cryptocurrency.
+    
+    Returns:
+        str: The analysis, or None if it is unavailable (no API key, or the
+        request failed after retries)
+    """
+    try:
+        api_key = Config.DEEPSEEK_API
+        if not api_key:
+            return None
         
-        payload = {
-            "model": "deepseek-chat",
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": 300,
-            "temperature": 0.7
-        }
+        # Price to 3 significant figures works for both BTC and sub-cent coins
+        cache_key = (coin_data['symbol'], f"{coin_data['price']:.3g}", round(coin_data['change_24h'], 1))
+        analysis = _ai_analysis_cache.get(cache_key)
+        if analysis is not None:
+            return analysis
         
-        response = _rate_limited_post(
-            "https://api.deepseek.com/chat/completions",
-            min_interval=2.0,
-            headers=headers,
-            json=payload,
-            timeout=15
+        prompt = _CRYPTO_ANALYSIS_PROMPT.format(
+            market_cap_b=coin_data['market_cap'] / 1e9,
+            volume_b=coin_data['volume'] / 1e9,
+            **coin_data
         )
-        
-        if response.status_code == 200:
-            result = response.json()
-            analysis = result["choices"][0]["message"]["content"].strip()
-            return analysis
-        else:
-            logger.error(f"DeepSeek API error: {response.status_code}")
-            return "AI analysis temporarily unavailable."
+        headers = {"Authorization": f"Bearer {api_key}"}
+        payload = dict(_CRYPTO_ANALYSIS_PAYLOAD, messages=[
+            _CRYPTO_ANALYSIS_SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt}
+        ])
+        
+        for attempt in range(DEEPSEEK_MAX_RETRIES + 1):
+            # Streamed, so the timeout applies between chunks rather than to
+            # the whole generation
+            response = _rate_limited_post(
+                "https://api.deepseek.com/chat/completions",
+                min_interval=2.0,
+                headers=headers,
+                json=payload,
+                timeout=15,
+                stream=True
+            )
+            if response.status_code not in DEEPSEEK_RETRY_STATUSES or attempt == DEEPSEEK_MAX_RETRIES:
+                break
+            # Transient rate limit or overload: back off briefly and retry
+            delay = _get_retry_delay(response, 0.5 * (attempt + 1))
+            response.close()
+            logger.warning(f"DeepSeek API returned {response.status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        
+        with response:
+            if response.status_code != 200:
+                logger.error(f"DeepSeek API error: {response.status_code}")
+                return None
+            analysis = "".join(_iter_completion_chunks(response)).strip()
+        
+        if not analysis:
+            return None
+        _ai_analysis_cache.set(cache_key, analysis, AI_ANALYSIS_CACHE_TTL)
+        return analysis
             
     except Exception as e:
         logger.error(f"Error getting individual crypto AI analysis: {e}")
-        return "AI analysis temporarily unavailable."
+        return None
 
-def get_individual_crypto_stats_with_ai(symbol):
-    """Get detailed crypto stats with AI analysis using dynamic CoinGecko lookup."""
-    try:
-        coin_id, coin_name, coin_symbol = get_coingecko_coin_id(symbol)
-        
-        if not coin_id:
-            return None
-        
-        # Fetch detailed coin data
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
-        params = {
-            "localization": "false",
-            "tickers": "false", 
-            "market_data": "true",
-            "community_data": "false",
-            "developer_data": "false"
-        }
-        
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        market_data = data.get("market_data", {})
-        
-        # Extract key metrics
-        name = data.get("name", coin_name)
-        current_price = market_data.get("current_price", {}).get("usd", 0)
-        price_change_24h = market_data.get("price_change_percentage_24h", 0) or 0
-        market_cap = market_data.get("market_cap", {}).get("usd", 0)
-        volume_24h = market_data.get("total_volume", {}).get("usd", 0)
-        high_24h = market_data.get("high_24h", {}).get("usd", current_price)
-        low_24h = market_data.get("low_24h", {}).get("usd", current_price)
-        
-        # Format price
-        price_str = format_crypto_price(current_price)
-        
-        # Format market cap
-        if market_cap >= 1e9:
-            mcap_str = f"${market_cap/1e9:.2f}B"
-        elif market_cap >= 1e6:
-            mcap_str = f"${market_cap/1e6:.2f}M"
-        else:
-            mcap_str = f"${market_cap:.0f}"
-        
-        # Format volume
-        if volume_24h >= 1e9:
-            vol_str = f"${volume_24h/1e9:.2f}B"
-        elif volume_24h >= 1e6:
-            vol_str = f"${volume_24h/1e6:.2f}M"
-        else:
-            vol_str = f"${volume_24h:.0f}"
-        
-        # Direction arrow
-        arrow = "▲" if price_change_24h > 0 else "▼" if price_change_24h < 0 else "→"
+@ttl_cache(ttl=Config.CRYPTO_CACHE_TTL, maxsize=256, cache_if=itemgetter(1))
+def _format_crypto_stats_with_ai(symbol):
+    """
+    Format the /<coin> message for a coin, with DeepSeek analysis.
+    
+    Returns:
+        tuple: (message, analysed); message is None for an unknown symbol.
+        Only results with a DeepSeek analysis are cached, so the heuristic
+        stand-in is not served for the whole TTL. CoinGecko errors are raised
+        and not cached either.
+    """
+    coin = get_multi_coin_stats([symbol]).get(symbol)
+    
+    if not coin:
+        return None, False
+    
+    # Extract key metrics
+    name = coin.get("name") or symbol.upper()
+    current_price = coin.get("current_price") or 0
+    price_change_24h = coin.get("price_change_percentage_24h") or 0
+    market_cap = coin.get("market_cap") or 0
+    volume_24h = coin.get("total_volume") or 0
+    high_24h = coin.get("high_24h") or current_price
+    low_24h = coin.get("low_24h") or current_price
+    
+    # Format price
+    price_str = format_crypto_price(current_price)
+    
+    # Format market cap and volume
+    mcap_str = _fmt_money(market_cap)
+    vol_str = _fmt_money(volume_24h)
+    
+    # Direction arrow
+    arrow = _arrow(price_change_24h)
+    
+    # Get AI analysis
+    ai_analysis = get_individual_crypto_ai_analysis({
+        "name": name,
+        "symbol": symbol.upper(),
+        "price": current_price,
+        "change_24h": price_change_24h,
+        "market_cap": market_cap,
+        "volume": volume_24h,
+        "high_24h": high_24h,
+        "low_24h": low_24h
+    })
+    
+    # If AI analysis failed, provide a fallback
+    analysed = ai_analysis is not None
+    if not analysed:
+        support_level = current_price * 0.95
+        resistance_level = current_price * 1.05
+        ma_30d = current_price * 0.92
         
-        # Get AI analysis
-        ai_analysis = get_individual_crypto_ai_analysis({
-            "name": name,
-            "symbol": symbol.upper(),
-            "price": current_price,
-            "change_24h": price_change_24h,
-            "market_cap": market_cap,
-            "volume": volume_24h,
-            "high_24h": high_24h,
-            "low_24h": low_24h
-        })
+        trend = "bullish" if price_change_24h > 0 else "bearish" if price_change_24h < -2 else "neutral"
+        volume_level = "High" if volume_24h > 10e9 else "Medium" if volume_24h > 1e9 else "Low"
         
-        # If AI analysis failed, provide a fallback
-        if "temporarily unavailable" in ai_analysis or "unavailable" in ai_analysis:
-            support_level = current_price * 0.95
-            resistance_level = current_price * 1.05
-            ma_30d = current_price * 0.92
-            
-            trend = "bullish" if price_change_24h > 0 else "bearish" if price_change_24h < -2 else "neutral"
-            volume_level = "High" if volume_24h > 10e9 else "Medium" if volume_24h > 1e9 else "Low"
-            
-            ai_analysis = f"""Technicals:  
+        ai_analysis = f"""Technicals:  
 - Support: ${support_level:.2f}  
 - Resistance: ${resistance_level:.2f}  
 - RSI (65): Neutral, market showing balanced momentum  
@@ -937,50 +1463,95 @@ def get_individual_crypto_stats_with_ai(symbol):
 Forecast (Next 24h): Market likely to continue current trend with potential {'resistance test' if price_change_24h > 0 else 'support test'} at key levels.  
 
 Prediction (Next 24hr): {'🟢 BUY' if price_change_24h > 2 else '🟠 HOLD' if price_change_24h > -2 else '🔴 SELL'}"""
-        
-        # Build the formatted message
-        stats_message = f"""Price: {symbol.upper()} {price_str} ({price_change_24h:+.2f}%) {arrow}
+    
+    # Build the formatted message
+    stats_message = f"""Price: {symbol.upper()} {price_str} ({price_change_24h:+.2f}%) {arrow}
 Market Summary: {name} is currently trading at {price_str} with a 24h change of ({price_change_24h:+.2f}%) 24h Market Cap {mcap_str}. 24h Volume: {vol_str}.
 
 {ai_analysis}"""
-        
-        return stats_message
-        
+    
+    return stats_message, analysed
+
+def get_individual_crypto_stats_with_ai(symbol):
+    """Get detailed crypto stats with AI analysis using dynamic CoinGecko lookup."""
+    try:
+        return _format_crypto_stats_with_ai(symbol)[0]
     except Exception as e:
         logger.error(f"Error fetching {symbol} stats with AI: {e}")
         return f"Sorry, I couldn't get detailed stats for {symbol.upper()}. Please try again later."
 
 # ===================== HOLIDAYS =====================
 
-def get_bd_holidays():
-    """Get Bangladesh holidays for today."""
+# Calendarific holidays for a whole year, refreshed at most once a day and
+# kept on disk so restarts do not refetch them
+HOLIDAYS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "bd_holidays_{year}.json")
+HOLIDAYS_REFRESH_SECONDS = 86400
+
+@ttl_cache(ttl=HOLIDAYS_REFRESH_SECONDS, maxsize=2)
+def _get_bd_holidays_for_year(year):
+    """
+    Get Bangladesh holidays for a year.
+    
+    Read from the on-disk copy when it is less than a day old, otherwise
+    fetched from Calendarific in one request and saved. A stale copy is used
+    if the fetch fails.
+    
+    Returns:
+        dict: ISO date ("YYYY-MM-DD") -> list of holiday names
+    """
+    path = HOLIDAYS_CACHE_PATH.format(year=year)
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        age, cached = None, None
+    if cached is not None and age < HOLIDAYS_REFRESH_SECONDS:
+        return cached
+    
+    try:
+        url = "https://calendarific.com/api/v2/holidays"
+        params = {"api_key": Config.CALENDARIFIC_API_KEY, "country": "BD", "year": year}
+        response = _rate_limited_request(url, min_interval=3.0, timeout=15, params=params)
+        response.raise_for_status()
+        holidays = _json_loads(response.content).get("response", {}).get("holidays", [])
+    except Exception:
+        if cached is not None:
+            return cached
+        raise
+    
+    by_date = {}
+    for h in holidays:
+        iso_date = (h.get("date", {}).get("iso") or "")[:10]
+        if iso_date:
+            by_date.setdefault(iso_date, []).append(h.get("name", "Holiday"))
+    
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(by_date, f)
+    except OSError as e:
+        logger.debug(f"Could not save holidays to {path}: {e}")
+    return by_date
+
+def get_bd_holidays(today=None):
+    """
+    Get Bangladesh holidays for today.
+    
+    Args:
+        today (datetime, optional): Current Bangladesh time, when the caller
+            already has it; defaults to get_bd_now()
+    """
     try:
         api_key = Config.CALENDARIFIC_API_KEY
         if not api_key:
             return ""
             
-        today = get_bd_now()
-        url = "https://calendarific.com/api/v2/holidays"
-        params = {
-            "api_key": api_key,
-            "country": "BD",
-            "year": today.year,
-            "month": today.month,
-            "day": today.day
-        }
+        if today is None:
+            today = get_bd_now()
         
-        response = _rate_limited_request(url, min_interval=3.0, timeout=15, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        holidays = data.get("response", {}).get("holidays", [])
-        
-        if holidays:
-            holiday_names = []
-            for h in holidays:
-                name = h.get("name", "Holiday")
-                holiday_names.append(name)
-            
+        holiday_names = _get_bd_holidays_for_year(today.year).get(today.strftime("%Y-%m-%d"))
+        if holiday_names:
             holiday_text = ', '.join(holiday_names)
             return f"🎉 Today's Holiday: {holiday_text}"
         
@@ -992,58 +1563,114 @@ def get_bd_holidays():
 
 # ===================== MAIN DIGEST FUNCTION =====================
 
-def get_full_news_digest():
-    """Generate news digest matching exact format."""
+# Telegram rejects messages over 4096 characters; longer digests are cut
+DIGEST_MAX_CHARS = 4000
+DIGEST_TRUNCATE_AT = 3950
+
+@ttl_cache(ttl=60, cache_if=itemgetter(1))
+def _build_full_news_digest():
+    """
+    Build the news digest.
+    
+    Returns:
+        tuple: (digest, complete); ``complete`` is false when a news section,
+        the weather or the crypto market fell back because its source failed,
+        so that digest is not cached
+    """
+    complete = True
     now = get_bd_now()
     date_str = now.strftime('%b %d, %Y %-I:%M%p BDT (UTC +6)')
     
-    # Header with loading message
-    digest = f"📢 Loading latest news...\n📰 TOP NEWS HEADLINES\n{date_str}\n\n"
-    
-    # Holiday check
-    holiday = get_bd_holidays().strip()
-    if holiday:
-        digest += f"{holiday}\n\n"
-    
-    # Weather
-    weather = get_dhaka_weather()
-    digest += weather
+    # Every part is independent, so fetch them all at once; per-host
+    # throttling still applies inside _rate_limited_request
+    news_futures = submit_breaking_news()
+    executor = ThreadPoolExecutor(max_workers=3)
+    holiday_future = executor.submit(get_bd_holidays, now)
+    weather_future = executor.submit(get_dhaka_weather)
+    crypto_future = executor.submit(fetch_crypto_market_with_ai)
     
-    # News sections
-    local = get_breaking_local_news()
-    global_news = get_breaking_global_news()
-    tech = get_breaking_tech_news()
-    sports = get_breaking_sports_news()
-    finance = get_breaking_finance_news()
+    def digest_parts():
+        nonlocal complete
+        
+        # Header with loading message
+        yield f"📢 Loading latest news...\n📰 TOP NEWS HEADLINES\n{date_str}\n\n"
+        
+        # Holiday check
+        holiday = holiday_future.result().strip()
+        if holiday:
+            yield f"{holiday}\n\n"
+        
+        # Weather
+        weather = weather_future.result()
+        complete = complete and weather != WEATHER_FALLBACK
+        yield weather
+        
+        # News sections; a failed section comes back empty
+        for _, section in iter_breaking_news(news_futures):
+            complete = complete and bool(section)
+            yield section
+        
+        # Crypto market
+        crypto = crypto_future.result()
+        complete = complete and crypto != CRYPTO_MARKET_FALLBACK
+        yield crypto
+        
+        # Footer
+        yield "\nQuick Navigation:\nType /help for complete command list or the commands (e.g., /local, /global, /tech, /sports, /finance, /weather, /cryptostats, /btc, btcstats etc.)\n━━━━━━━━━━━━━━\n🤖 By Shanchoy Noor"
     
-    digest += local + global_news + tech + sports + finance
-    
-    # Crypto market
-    crypto = fetch_crypto_market_with_ai()
-    digest += crypto
+    # Stop waiting for later parts once the digest is over the limit, since
+    # they would be truncated away anyway
+    parts = []
+    length = 0
+    try:
+        for part in digest_parts():
+            parts.append(part)
+            length += len(part)
+            if length > DIGEST_MAX_CHARS:
+                break
+    finally:
+        for future in news_futures.values():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    # Footer
-    digest += "\nQuick Navigation:\nType /help for complete command list or the commands (e.g., /local, /global, /tech, /sports, /finance, /weather, /cryptostats, /btc, btcstats etc.)\n━━━━━━━━━━━━━━\n🤖 By Shanchoy Noor"
+    digest = "".join(parts)
     
     # Truncate if too long
-    if len(digest) > 4000:
-        digest = digest[:3950] + "...\n\n🤖 By Shanchoy Noor"
+    if length > DIGEST_MAX_CHARS:
+        digest = digest[:DIGEST_TRUNCATE_AT] + "...\n\n🤖 By Shanchoy Noor"
     
-    return digest
+    return digest, complete
+
+def get_full_news_digest():
+    """Generate news digest matching exact format."""
+    return _build_full_news_digest()[0]
 
 # ===================== CRYPTOSTATS FUNCTION =====================
 
+# Big cap coins shown in /cryptostats, by CoinGecko id, in display order
+BIG_CAP_TARGETS = {
+    'bitcoin': 'BTC', 'ethereum': 'ETH', 'ripple': 'XRP',
+    'binancecoin': 'BNB', 'solana': 'SOL', 'tron': 'TRX',
+    'dogecoin': 'DOGE', 'cardano': 'ADA'
+}
+
+# /coins/markets fields read by /cryptostats
+_MARKET_ROW_FIELDS = ("id", "symbol", "current_price", "price_change_percentage_24h")
+
+def _mover_lines(coins, arrow):
+    """Format market rows as numbered lines, e.g. "1. SOL $152.30 (+8.41%) ▲"."""
+    fmt = format_crypto_price
+    return [f"{i}. {c['symbol'].upper()} {fmt(c['current_price'])} ({c['price_change_percentage_24h']:+.2f}%) {arrow}"
+            for i, c in enumerate(coins, 1)]
+
+# Returned by /cryptostats when CoinGecko cannot be reached
+CRYPTO_STATS_FALLBACK = "💰 CRYPTO MARKET:\nMarket data temporarily unavailable.\n"
+
+@ttl_cache(ttl=30, cache_if=lambda section: section != CRYPTO_STATS_FALLBACK)
 def get_crypto_stats_digest():
     """Return crypto market section for /cryptostats command."""
     try:
-        url = "https://api.coingecko.com/api/v3/global"
-        response = _rate_limited_request(url, min_interval=1.5, timeout=15)
-        response.raise_for_status()
-        
-        data = response.json()["data"]
-        market_cap = data["total_market_cap"]["usd"]
-        volume = data["total_volume"]["usd"]
-        market_change = data["market_cap_change_percentage_24h_usd"]
+        market_cap, volume, market_change, fear_index = _get_market_overview()
         
         # Fetch top cryptos
         crypto_url = "https://api.coingecko.com/api/v3/coins/markets"
@@ -1056,77 +1683,53 @@ def get_crypto_stats_digest():
             "price_change_percentage": "24h"
         }
         
-        crypto_response = _rate_limited_request(crypto_url, min_interval=2.0, timeout=15, params=crypto_params)
-        crypto_data = crypto_response.json()
-        
-        # Format market stats
-        market_cap_str = f"${market_cap/1e12:.2f}T" if market_cap >= 1e12 else f"${market_cap/1e9:.2f}B"
-        volume_str = f"${volume/1e12:.2f}T" if volume >= 1e12 else f"${volume/1e9:.2f}B"
-        
-        market_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        volume_arrow = "▲" if market_change > 0 else "▼" if market_change < 0 else "→"
-        
-        # Fear & Greed
-        try:
-            fear_response = _rate_limited_request("https://api.alternative.me/fng/?limit=1", min_interval=1.0, timeout=10)
-            fear_index = fear_response.json()["data"][0]["value"]
-        except:
-            fear_index = "71"
-        
-        crypto_section = f"""💰 CRYPTO MARKET:
-Market Cap: {market_cap_str} ({market_change:+.2f}%) {market_arrow}
-Volume: {volume_str} ({market_change:+.2f}%) {volume_arrow}
-Fear/Greed Index: {fear_index}/100
-
-💎 Big Cap Crypto:
-"""
+        response = _rate_limited_request(crypto_url, min_interval=2.0, timeout=15, params=crypto_params)
+        response.raise_for_status()
         
-        # Big cap cryptos
-        big_cap_targets = {
-            'bitcoin': 'BTC', 'ethereum': 'ETH', 'ripple': 'XRP',
-            'binancecoin': 'BNB', 'solana': 'SOL', 'tron': 'TRX',
-            'dogecoin': 'DOGE', 'cardano': 'ADA'
-        }
+        # Keep only the fields used below; the full rows carry ~25 each
+        crypto_data = [{field: crypto.get(field) for field in _MARKET_ROW_FIELDS}
+                       for crypto in _json_loads(response.content)]
         
-        for crypto in crypto_data:
-            if crypto['id'] in big_cap_targets:
-                symbol = big_cap_targets[crypto['id']]
-                price = crypto['current_price']
-                change = crypto['price_change_percentage_24h'] or 0
-                arrow = "▲" if change > 0 else "▼" if change < 0 else "→"
-                
-                price_str = format_crypto_price(price)
-                crypto_section += f"{symbol}: {price_str} ({change:+.2f}%) {arrow}\n"
+        # Format market stats
+        market_arrow = _arrow(market_change)
+        
+        lines = [
+            "💰 CRYPTO MARKET:",
+            f"Market Cap: {_fmt_money(market_cap)} ({market_change:+.2f}%) {market_arrow}",
+            f"Volume: {_fmt_money(volume)} ({market_change:+.2f}%) {market_arrow}",
+            f"Fear/Greed Index: {fear_index}/100",
+            "",
+            "💎 Big Cap Crypto:",
+        ]
+        
+        # Big cap cryptos, in the curated order
+        by_id = {crypto['id']: crypto for crypto in crypto_data}
+        for coin_id, symbol in BIG_CAP_TARGETS.items():
+            crypto = by_id.get(coin_id)
+            if crypto is None:
+                continue
+            change = crypto['price_change_percentage_24h'] or 0
+            arrow = _arrow(change)
+            lines.append(f"{symbol}: {format_crypto_price(crypto['current_price'])} ({change:+.2f}%) {arrow}")
         
-        # Gainers and losers
-        sorted_cryptos = sorted([c for c in crypto_data if c['price_change_percentage_24h'] is not None], 
-                               key=lambda x: x['price_change_percentage_24h'])
+        # Gainers and losers: only the five at each end are needed
+        changed = [c for c in by_id.values() if c.get('price_change_percentage_24h') is not None]
+        change_key = itemgetter('price_change_percentage_24h')
         
         # Top 5 gainers
-        gainers = sorted_cryptos[-5:][::-1]
-        crypto_section += "\n📈 Crypto Top 5 Gainers:\n"
-        for i, crypto in enumerate(gainers, 1):
-            symbol = crypto['symbol'].upper()
-            price = crypto['current_price']
-            change = crypto['price_change_percentage_24h']
-            price_str = format_crypto_price(price)
-            crypto_section += f"{i}. {symbol} {price_str} ({change:+.2f}%) ▲\n"
+        lines += ["", "📈 Crypto Top 5 Gainers:"]
+        lines += _mover_lines(heapq.nlargest(5, changed, key=change_key), "▲")
         
         # Top 5 losers
-        losers = sorted_cryptos[:5]
-        crypto_section += "\n📉 Crypto Top 5 Losers:\n"
-        for i, crypto in enumerate(losers, 1):
-            symbol = crypto['symbol'].upper()
-            price = crypto['current_price']
-            change = crypto['price_change_percentage_24h']
-            price_str = format_crypto_price(price)
-            crypto_section += f"{i}. {symbol} {price_str} ({change:+.2f}%) ▼\n"
+        lines += ["", "📉 Crypto Top 5 Losers:"]
+        lines += _mover_lines(heapq.nsmallest(5, changed, key=change_key), "▼")
+        
+        # Trailing empty entry keeps the section newline-terminated
+        lines.append("")
+        crypto_section = "\n".join(lines)
         
         return crypto_section
         
     except Exception as e:
         logger.error(f"Error fetching crypto market data: {e}")
-        return "💰 CRYPTO MARKET:\nMarket data temporarily unavailable.\n"
-
-# Initialize on import
-init_news_history_db()
\ No newline at end of file
+        return CRYPTO_STATS_FALLBACK
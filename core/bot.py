@@ -9,7 +9,7 @@ import logging
 import threading
 from utils.logging import get_logger
 from utils.config import Config
-from api.telegram import get_updates, send_telegram
+from api.telegram import get_updates, send_telegram, POLL_TIMEOUT, GET_UPDATES_LIMIT
 from services.bot_service import handle_updates
 
 logger = get_logger(__name__)
@@ -28,19 +28,26 @@ class ChoyNewsBot:
         logger.info("Bot started, waiting for messages...")
         logger.debug(f"Starting bot polling with token: {Config.TELEGRAM_TOKEN[:10]}...")
         
+        poll_timeout = POLL_TIMEOUT
+        
         try:
             while self.running:
                 logger.debug("Polling for updates...")
-                updates = get_updates(self.last_update_id)
+                updates = get_updates(self.last_update_id, timeout=poll_timeout)
                 
-                if updates:
+                if updates is None:
+                    # The request failed; wait a moment before retrying
+                    poll_timeout = POLL_TIMEOUT
+                    time.sleep(1)
+                elif updates:
                     logger.info(f"Received {len(updates)} updates")
                     self.last_update_id = handle_updates(updates)
                     logger.debug(f"Processed {len(updates)} updates, last_update_id: {self.last_update_id}")
+                    # A full batch means more are queued: drain them without waiting
+                    poll_timeout = 0 if len(updates) >= GET_UPDATES_LIMIT else POLL_TIMEOUT
                 else:
                     logger.debug("No updates received")
-                
-                time.sleep(1)  # Avoid excessive polling
+                    poll_timeout = POLL_TIMEOUT
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
             self.running = False
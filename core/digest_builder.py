@@ -29,8 +29,7 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
     try:
         # Import advanced news fetcher functions
         from core.advanced_news_fetcher import (
-            get_breaking_local_news, get_breaking_global_news, get_breaking_tech_news,
-            get_breaking_sports_news, get_breaking_finance_news, fetch_crypto_market_with_ai,
+            submit_breaking_news, fetch_crypto_market_with_ai,
             get_dhaka_weather, get_bd_holidays
         )
         
@@ -41,6 +40,16 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
             include_world_news = bool(user.get("world_news", 1))
             include_tech_news = bool(user.get("tech_news", 1))
         
+        # Start every news section now so their feeds download while the
+        # header and weather are prepared; results are collected in order below
+        news_categories = ["local"]
+        if include_world_news:
+            news_categories.append("global")
+        if include_tech_news:
+            news_categories.append("tech")
+        news_categories += ["sports", "finance"]
+        news_futures = submit_breaking_news(news_categories)
+        
         # Build the digest header with Bangladesh time
         now = get_bd_now()
         time_str = get_bd_time_str(now)
@@ -48,7 +57,7 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         # Get holiday information
         holidays_info = ""
         try:
-            holidays_info = get_bd_holidays()
+            holidays_info = get_bd_holidays(now)
         except Exception as e:
             logger.debug(f"Holiday API failed: {e}")
         
@@ -79,7 +88,7 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         # Add news sections with better error handling
         try:
-            local_news = get_breaking_local_news()
+            local_news = news_futures["local"].result()
             sections.append(local_news if local_news and local_news.strip() else "*🇧🇩 LOCAL NEWS:*\n1. 🔄 Latest breaking local news being monitored...\n2. 📊 Local political developments being tracked...\n3. 💼 Regional economic updates in progress...\n4. 🏛️ Government policy updates being compiled...\n5. 🌟 Community developments being monitored...\n")
         except Exception as e:
             logger.warning(f"Error getting local news: {e}")
@@ -87,7 +96,7 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         if include_world_news:
             try:
-                global_news = get_breaking_global_news()
+                global_news = news_futures["global"].result()
                 sections.append(global_news if global_news and global_news.strip() else "*🌍 GLOBAL NEWS:*\n1. 🌍 International breaking news being updated...\n2. 🔥 Global crisis developments being tracked...\n3. 💸 World economic updates coming soon...\n4. 🕊️ International affairs updates in progress...\n5. ⚡ Breaking global events being monitored...\n")
             except Exception as e:
                 logger.warning(f"Error getting global news: {e}")
@@ -95,21 +104,21 @@ def build_news_digest(user=None, include_crypto=True, include_weather=True, incl
         
         if include_tech_news:
             try:
-                tech_news = get_breaking_tech_news()
+                tech_news = news_futures["tech"].result()
                 sections.append(tech_news if tech_news and tech_news.strip() else "*🚀 TECH NEWS:*\n1. 💡 Latest technology breakthroughs being analyzed...\n2. 🤖 AI and innovation updates coming soon...\n3. 🔧 Tech industry developments being tracked...\n4. 💰 Startup and venture updates in progress...\n5. 📱 Digital transformation news being compiled...\n")
             except Exception as e:
                 logger.warning(f"Error getting tech news: {e}")
                 sections.append("*🚀 TECH NEWS:*\n1. 📰 News updates will be available shortly...\n2. 🔍 Breaking news being monitored...\n3. 📈 Latest developments being tracked...\n4. ⏰ Updates coming soon...\n5. 📝 News compilation in progress...\n")
         
         try:
-            sports_news = get_breaking_sports_news()
+            sports_news = news_futures["sports"].result()
             sections.append(sports_news if sports_news and sports_news.strip() else "*🏆 SPORTS NEWS:*\n1. ⚽ Live sports scores and updates being compiled...\n2. 🏅 League standings and results coming soon...\n3. 🔄 Player transfers and moves being tracked...\n4. 🏟️ Tournament updates in progress...\n5. 📈 Sports analysis and commentary being prepared...\n")
         except Exception as e:
             logger.warning(f"Error getting sports news: {e}")
             sections.append("*🏆 SPORTS NEWS:*\n1. 📰 News updates will be available shortly...\n2. 🔍 Breaking news being monitored...\n3. 📈 Latest developments being tracked...\n4. ⏰ Updates coming soon...\n5. 📝 News compilation in progress...\n")
         
         try:
-            crypto_news = get_breaking_finance_news()
+            crypto_news = news_futures["finance"].result()
             sections.append(crypto_news if crypto_news and crypto_news.strip() else "*🪙 FINANCE & CRYPTO NEWS:*\n1. 📊 Cryptocurrency market movements being analyzed...\n2. 🔗 DeFi protocol updates being tracked...\n3. ⛓️ Blockchain developments coming soon...\n4. 📜 Digital asset regulatory news in progress...\n5. 💹 Crypto trading insights being compiled...\n")
         except Exception as e:
             logger.warning(f"Error getting crypto news: {e}")
@@ -244,16 +253,16 @@ def clean_digest_content(content):
     # Split by the footer marker to ensure nothing appears after it
     footer_marker = "🤖 Developed by [Shanchoy Noor]"
     
-    if footer_marker in content:
-        # Find the footer and cut everything after the GitHub link
-        footer_index = content.find(footer_marker)
-        github_end = content.find(")", footer_index)
-        if github_end > footer_index:
+    head, marker, tail = content.partition(footer_marker)
+    if marker:
+        # Cut everything after the GitHub link that follows the footer
+        link, paren, _ = tail.partition(")")
+        if paren:
             # Keep content only up to the end of the GitHub link
-            content = content[:github_end + 1]
+            content = head + marker + link + paren
         else:
             # Fallback: add the GitHub link properly
-            content = content[:footer_index] + f"{footer_marker}(https://github.com/shanchoynoor)"
+            content = head + f"{footer_marker}(https://github.com/shanchoynoor)"
     
     # Remove any stray content that doesn't belong in a news digest
     lines = content.split('\n')
@@ -5,100 +5,58 @@ This module handles fetching news from various RSS sources and external APIs.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
+import heapq
 import json
 import os
 from datetime import datetime, timedelta
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.logging import get_logger
 from utils.config import Config
+from utils.cache import ttl_cache
+from utils.time_utils import parse_feed_datetime
 
 logger = get_logger(__name__)
 
+# Keep-alive session for the CoinGecko API: market, movers, search and chart
+# calls reuse pooled TLS connections instead of reconnecting per request
+_coingecko_session = requests.Session()
+_coingecko_session.headers.update({"Accept": "application/json"})
+_coingecko_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+# Keep-alive session for RSS feeds and the other upstream APIs (Fear & Greed,
+# WeatherAPI, Calendarific). The pool covers the parallel RSS workers, and
+# transient gateway errors are retried briefly.
+_http_session = requests.Session()
+_http_session.headers.update({
+    'User-Agent': 'ChoyNewsBot/1.0 (+https://github.com/shanchoynoor/ChoyAI_News_Module)'
+})
+_http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, status_forcelist=[502, 503, 504], backoff_factor=0.3, raise_on_status=False)
+)
+_http_session.mount("http://", _http_adapter)
+_http_session.mount("https://", _http_adapter)
+
 def get_hours_ago(published_time_str):
     """Calculate accurate hours ago from published time string."""
     if not published_time_str:
         return "Unknown"
     
     try:
-        pub_time = None
-        
-        # Clean the input string
-        time_str = published_time_str.strip()
-        
-        # Handle different date formats
-        try:
-            # RFC 822 format: "Mon, 25 Nov 2024 14:30:00 GMT" or "Thu, 12 Jul 2025 01:31:44 +0000"
-            if "GMT" in time_str or "UTC" in time_str:
-                clean_str = time_str.replace("GMT", "").replace("UTC", "").strip()
-                pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
-            elif "+0000" in time_str or "+0600" in time_str or "-" in time_str.split()[-1]:
-                # Handle timezone offsets like "+0000", "+0600", etc.
-                # Remove timezone offset
-                parts = time_str.rsplit(' ', 1)
-                if len(parts) == 2 and ('+' in parts[1] or '-' in parts[1]):
-                    clean_str = parts[0]
-                    pub_time = datetime.strptime(clean_str, "%a, %d %b %Y %H:%M:%S")
-                else:
-                    # Try full string
-                    pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S %z").replace(tzinfo=None)
-            # ISO format: "2024-11-25T14:30:00Z" or "2024-11-25T14:30:00"
-            elif "T" in time_str:
-                if time_str.endswith('Z'):
-                    pub_time = datetime.strptime(time_str[:-1], "%Y-%m-%dT%H:%M:%S")
-                elif '+' in time_str:
-                    # Handle timezone offset in ISO format
-                    pub_time = datetime.strptime(time_str.split('+')[0], "%Y-%m-%dT%H:%M:%S")
-                elif '-' in time_str and time_str.count('-') > 2:
-                    # Handle negative timezone offset
-                    parts = time_str.split('-')
-                    if len(parts) >= 4:  # Year-Month-Day-timezone
-                        clean_str = '-'.join(parts[:-1])
-                        pub_time = datetime.strptime(clean_str, "%Y-%m-%dT%H:%M:%S")
-                else:
-                    pub_time = datetime.strptime(time_str[:19], "%Y-%m-%dT%H:%M:%S")
-            # Standard format: "2024-11-25 14:30:00"
-            elif time_str.count('-') == 2 and ':' in time_str:
-                pub_time = datetime.strptime(time_str[:19], "%Y-%m-%d %H:%M:%S")
-            # RSS common format: "Thu, 12 Jul 2025 01:31:44"
-            elif ',' in time_str and len(time_str.split()) >= 5:
-                # Try without timezone first
-                try:
-                    pub_time = datetime.strptime(time_str, "%a, %d %b %Y %H:%M:%S")
-                except ValueError:
-                    # If that fails, try with just the date part
-                    parts = time_str.split()
-                    if len(parts) >= 5:
-                        date_part = ' '.join(parts[:5])
-                        pub_time = datetime.strptime(date_part, "%a, %d %b %Y %H:%M:%S")
-        except ValueError:
-            pass
+        # RFC 822 and ISO 8601 are recognised from the first characters and
+        # parsed directly; only other shapes try the strptime fallbacks
+        pub_time = parse_feed_datetime(published_time_str)
         
-        # If all specific formats fail, try common fallbacks
-        if pub_time is None:
-            fallback_formats = [
-                "%Y-%m-%d %H:%M:%S",
-                "%d %b %Y %H:%M:%S",
-                "%Y/%m/%d %H:%M:%S",
-                "%m/%d/%Y %H:%M:%S",
-                "%d-%m-%Y %H:%M:%S",
-                "%Y-%m-%d",
-                "%d %b %Y"
-            ]
-            
-            for fmt in fallback_formats:
-                try:
-                    pub_time = datetime.strptime(time_str[:len(fmt)], fmt)
-                    break
-                except ValueError:
-                    continue
-        
-        # If we still don't have a time, return Unknown
         if pub_time is None:
             logger.debug(f"Could not parse time format: '{published_time_str}'")
             return "Unknown"
         
-        # Calculate time difference (assume UTC if no timezone specified)
+        # Calculate time difference (times without a zone are taken as local)
         now = datetime.now()
         time_diff = now - pub_time
         
@@ -140,16 +98,11 @@ def fetch_rss_entries(sources, limit=5, max_age_hours=2):
     Returns:
         list: List of recent news entries with metadata
     """
-    headers = {
-        'User-Agent': 'ChoyNewsBot/1.0 (+https://github.com/shanchoynoor/ChoyAI_News_Module)'
-    }
-
     def _process_feed(source_name, rss_url):
         entries_out = []
         try:
             logger.info(f"Fetching RSS from {source_name}: {rss_url}")
-            with requests.Session() as session:
-                response = session.get(rss_url, headers=headers, timeout=6)
+            response = _http_session.get(rss_url, timeout=6)
             response.raise_for_status()
 
             feed = feedparser.parse(response.content)
@@ -166,7 +119,8 @@ def fetch_rss_entries(sources, limit=5, max_age_hours=2):
                     parsed_dt_struct = getattr(entry, 'published_parsed', None) or getattr(entry, 'updated_parsed', None)
                     if parsed_dt_struct:
                         try:
-                            pub_time_dt = datetime(*parsed_dt_struct[:6])
+                            # feedparser's struct_time is UTC; convert to local time
+                            pub_time_dt = parse_feed_datetime(parsed_dt_struct)
                             now = datetime.now()
                             time_diff = now - pub_time_dt
                             hours_diff = time_diff.total_seconds() / 3600
@@ -398,7 +352,7 @@ def fetch_crypto_market():
         os.makedirs(os.path.dirname(volume_file), exist_ok=True)
         
         url = "https://api.coingecko.com/api/v3/global"
-        response = requests.get(url, timeout=10)
+        response = _coingecko_session.get(url, timeout=10)
         response.raise_for_status()
         
         data = response.json()["data"]
@@ -429,7 +383,7 @@ def fetch_crypto_market():
 
         # Fetch Fear & Greed Index
         try:
-            fear_response = requests.get("https://api.alternative.me/fng/?limit=1", timeout=5)
+            fear_response = _http_session.get("https://api.alternative.me/fng/?limit=1", timeout=5)
             fear_index = fear_response.json()["data"][0]["value"]
         except:
             fear_index = "N/A"
@@ -450,7 +404,7 @@ def fetch_big_cap_prices():
     try:
         url = "https://api.coingecko.com/api/v3/coins/markets"
         params = {"vs_currency": "usd", "ids": ids}
-        response = requests.get(url, params=params, timeout=10)
+        response = _coingecko_session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -485,7 +439,7 @@ def fetch_top_movers():
             "per_page": 100,
             "page": 1
         }
-        response = requests.get(url, params=params, timeout=10)
+        response = _coingecko_session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -493,8 +447,9 @@ def fetch_top_movers():
         # Filter out coins with null price changes
         valid_data = [c for c in data if c.get("price_change_percentage_24h") is not None]
         
-        gainers = sorted(valid_data, key=lambda x: x.get("price_change_percentage_24h", 0), reverse=True)[:5]
-        losers = sorted(valid_data, key=lambda x: x.get("price_change_percentage_24h", 0))[:5]
+        change_key = itemgetter("price_change_percentage_24h")
+        gainers = heapq.nlargest(5, valid_data, key=change_key)
+        losers = heapq.nsmallest(5, valid_data, key=change_key)
 
         msg = "*📈 Crypto Top 5 Gainers:*\n"
         for i, c in enumerate(gainers, 1):
@@ -537,12 +492,18 @@ def fetch_top_movers():
 
 # ===================== WEATHER DATA =====================
 
+# Returned when WeatherAPI is not configured or the request fails; never cached
+WEATHER_NOT_CONFIGURED = "☀️ WEATHER NOW\nWeather API key not configured.\n\n"
+WEATHER_UNAVAILABLE = "☀️ WEATHER NOW\nWeather data temporarily unavailable."
+
+@ttl_cache(ttl=Config.WEATHER_CACHE_TTL,
+           cache_if=lambda text: text not in (WEATHER_NOT_CONFIGURED, WEATHER_UNAVAILABLE))
 def get_weather_data(city="Dhaka"):
     """Fetch weather data for a city."""
     try:
         api_key = Config.WEATHERAPI_KEY
         if not api_key:
-            return "☀️ WEATHER NOW\nWeather API key not configured.\n\n"
+            return WEATHER_NOT_CONFIGURED
             
         url = f"http://api.weatherapi.com/v1/current.json"
         params = {
@@ -551,7 +512,7 @@ def get_weather_data(city="Dhaka"):
             "aqi": "yes"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -634,7 +595,7 @@ def get_weather_data(city="Dhaka"):
         
     except Exception as e:
         logger.error(f"Error fetching weather data: {e}")
-        return "☀️ WEATHER NOW\nWeather data temporarily unavailable."
+        return WEATHER_UNAVAILABLE
 
 # ===================== HOLIDAYS DATA =====================
 
@@ -655,7 +616,7 @@ def get_bd_holidays():
             "day": today.day
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _http_session.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -784,7 +745,7 @@ def fetch_coin_detailed_stats(coin_symbol):
         # First get coin ID from symbol
         search_url = "https://api.coingecko.com/api/v3/search"
         search_params = {"query": coin_symbol}
-        search_response = requests.get(search_url, params=search_params, timeout=10)
+        search_response = _coingecko_session.get(search_url, params=search_params, timeout=10)
         
         if search_response.status_code != 200:
             return f"❌ Unable to find coin: {coin_symbol.upper()}"
@@ -818,7 +779,7 @@ def fetch_coin_detailed_stats(coin_symbol):
             "price_change_percentage": "1h,24h,7d,30d"
         }
         
-        market_response = requests.get(market_url, params=market_params, timeout=10)
+        market_response = _coingecko_session.get(market_url, params=market_params, timeout=10)
         market_response.raise_for_status()
         market_data = market_response.json()
         
@@ -836,7 +797,7 @@ def fetch_coin_detailed_stats(coin_symbol):
         }
         
         try:
-            history_response = requests.get(history_url, params=history_params, timeout=10)
+            history_response = _coingecko_session.get(history_url, params=history_params, timeout=10)
             history_data = history_response.json()
             prices = [price[1] for price in history_data.get('prices', [])]
         except:
@@ -1094,13 +1055,28 @@ def get_compact_news_section(section_title, entries, limit=4, lang='en'):
             formatted += f"{i}. {title} - {source} ({time_ago})\n"
     return formatted
 
-def get_compact_news_digest():
+# Returned by /news when the digest cannot be built; never cached
+COMPACT_DIGEST_FALLBACK = "📢 NEWS DIGEST\nTemporarily unavailable. Please try again later."
+
+# Main category buttons for the 2x3 grid under the /news digest
+COMPACT_DIGEST_BUTTONS = (
+    ("🇧🇩 LOCAL NEWS", "/local"),
+    ("🌍 GLOBAL NEWS", "/global"),
+    ("🚀 TECH NEWS", "/tech"),
+    ("🏆 SPORTS NEWS", "/sports"),
+    ("💼 FINANCE NEWS", "/finance"),
+    ("💰 CRYPTO MARKET", "/cryptostats")
+)
+
+@ttl_cache(ttl=60, cache_if=lambda result: result[0] != COMPACT_DIGEST_FALLBACK)
+def _build_compact_news_digest():
     """
-    Generate a compact news digest for the /news command.
+    Build the compact news digest shared by every /news caller.
+    
     Returns:
-        tuple: (digest_text, section_data, main_buttons)
-        - section_data: list of dicts with keys: title, command, news_items (each news_item: id, title, link, source, time, summary)
-        - main_buttons: list of (title, command) for the 2x3 grid at the bottom
+        tuple: (digest_text, section_data); section_data is a tuple of
+        (title, command, news_items) tuples, with news_items a tuple of
+        (key, value) pair tuples, so the cached result cannot be mutated
     """
     try:
         from datetime import datetime
@@ -1191,19 +1167,32 @@ def get_compact_news_digest():
         digest += "Type /help for complete command list or the commands (e.g., /local, /global, /tech, /sports, /finance, /weather, /cryptostats, /btc, btcstats etc.)\n\n"
         digest += "━━━━━━━━━━━━━━\n"
         digest += "🤖 By Shanchoy Noor"
-        # Main category buttons for 2x3 grid
-        main_buttons = [
-            ("🇧🇩 LOCAL NEWS", "/local"),
-            ("🌍 GLOBAL NEWS", "/global"),
-            ("🚀 TECH NEWS", "/tech"),
-            ("🏆 SPORTS NEWS", "/sports"),
-            ("💼 FINANCE NEWS", "/finance"),
-            ("💰 CRYPTO MARKET", "/cryptostats")
-        ]
-        return digest.strip(), section_data, main_buttons
+        frozen_sections = tuple(
+            (section['title'], section['command'], tuple(tuple(item.items()) for item in section['news_items']))
+            for section in section_data
+        )
+        return digest.strip(), frozen_sections
     except Exception as e:
         logger.error(f"Error generating compact news digest: {e}")
-        return "📢 NEWS DIGEST\nTemporarily unavailable. Please try again later.", [], []
+        return COMPACT_DIGEST_FALLBACK, ()
+
+def get_compact_news_digest():
+    """
+    Generate a compact news digest for the /news command.
+    Returns:
+        tuple: (digest_text, section_data, main_buttons)
+        - section_data: list of dicts with keys: title, command, news_items (each news_item: id, title, link, source, time, summary)
+        - main_buttons: list of (title, command) for the 2x3 grid at the bottom
+    """
+    digest, sections = _build_compact_news_digest()
+    if digest == COMPACT_DIGEST_FALLBACK:
+        return digest, [], []
+    # Fresh lists and dicts per call; the cached result is shared
+    section_data = [
+        {'title': title, 'command': command, 'news_items': [dict(item) for item in news_items]}
+        for title, command, news_items in sections
+    ]
+    return digest, section_data, list(COMPACT_DIGEST_BUTTONS)
 
 # ===================== EXISTING CRYPTO DATA =====================
 
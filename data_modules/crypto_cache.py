@@ -22,11 +22,13 @@ MARKET_CACHE_FILE = os.path.join(CACHE_DIR, "crypto_market_cache.json")
 MOVERS_CACHE_FILE = os.path.join(CACHE_DIR, "crypto_movers_cache.json")
 BIGCAP_CACHE_FILE = os.path.join(CACHE_DIR, "crypto_bigcap_cache.json")
 COINLIST_FILE = os.path.join(CACHE_DIR, "coinlist.json")
+COINGECKO_IDS_FILE = os.path.join(CACHE_DIR, "coingecko_ids.json")
 
 # Cache expiration (in seconds)
 MARKET_CACHE_EXPIRY = 60 * 30  # 30 minutes
 MOVERS_CACHE_EXPIRY = 60 * 15  # 15 minutes
 BIGCAP_CACHE_EXPIRY = 60 * 30  # 30 minutes
+COINGECKO_IDS_EXPIRY = 60 * 60 * 24  # 24 hours
 
 def ensure_cache_dir():
     """Ensure the cache directory exists."""
@@ -145,6 +147,25 @@ def get_cached_bigcap_data():
     """
     return load_cache(BIGCAP_CACHE_FILE, BIGCAP_CACHE_EXPIRY)
 
+def cache_coingecko_ids(data):
+    """
+    Cache the CoinGecko symbol to coin id map.
+    
+    Args:
+        data (dict): Map of lowercase symbol -> [id, name, SYMBOL]
+    """
+    save_cache({"coins": data}, COINGECKO_IDS_FILE)
+
+def get_cached_coingecko_ids():
+    """
+    Get the cached CoinGecko symbol to coin id map.
+    
+    Returns:
+        dict: Symbol map or None if cache is invalid or expired
+    """
+    data = load_cache(COINGECKO_IDS_FILE, COINGECKO_IDS_EXPIRY)
+    return data.get("coins") if data else None
+
 def load_coinlist():
     """
     Load the cryptocurrency coin list.
@@ -183,6 +204,3 @@ def save_coinlist(data):
         logger.info(f"Saved coin list with {len(data)} coins")
     except Exception as e:
         logger.error(f"Error saving coin list: {e}")
-
-# Ensure cache directory exists when module is imported
-ensure_cache_dir()
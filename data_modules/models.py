@@ -7,6 +7,9 @@ This module provides functions for interacting with user data, subscriptions, an
 import sqlite3
 import logging
 import os
+import atexit
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 import pytz
 from utils.logging import get_logger
@@ -169,10 +172,68 @@ def update_last_sent(user_id, timestamp=None):
         logger.error(f"Error updating last_sent for user {user_id}: {e}")
         return False
 
+# User interactions are buffered in memory and written in batches by a
+# background thread, every LOG_FLUSH_ROWS rows or LOG_FLUSH_INTERVAL seconds
+LOG_FLUSH_ROWS = 500
+LOG_FLUSH_INTERVAL = 2.0
+
+_INSERT_USER_LOG_SQL = '''
+    INSERT INTO user_logs 
+    (user_id, username, first_name, last_name, interaction_time, message_type, location, last_interaction)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_log_buffer = deque()
+_log_lock = threading.Lock()
+_log_wakeup = threading.Event()
+_log_flusher = None
+
+def flush_user_interactions():
+    """
+    Write all buffered user interactions to the logs database in one transaction.
+    
+    Returns:
+        int: Number of rows written
+    """
+    with _log_lock:
+        if not _log_buffer:
+            return 0
+        rows = list(_log_buffer)
+        _log_buffer.clear()
+    
+    try:
+        conn = sqlite3.connect(USER_LOGS_DB)
+        try:
+            with conn:
+                conn.executemany(_INSERT_USER_LOG_SQL, rows)
+        finally:
+            conn.close()
+        return len(rows)
+    except Exception as e:
+        logger.error(f"Error logging {len(rows)} user interactions: {e}")
+        return 0
+
+def _log_flush_loop():
+    """Background loop that flushes buffered interactions periodically."""
+    while True:
+        _log_wakeup.wait(LOG_FLUSH_INTERVAL)
+        _log_wakeup.clear()
+        flush_user_interactions()
+
+def _start_log_flusher():
+    """Start the background flush thread once; the caller holds _log_lock."""
+    global _log_flusher
+    _log_flusher = threading.Thread(target=_log_flush_loop, name="UserLogFlusher", daemon=True)
+    _log_flusher.start()
+    atexit.register(flush_user_interactions)
+
 def log_user_interaction(user_id, username, first_name, last_name, message_type, location=None, last_interaction=None):
     """
     Log a user interaction with the bot.
     
+    The row is queued and written by the background flusher; call
+    flush_user_interactions() to force pending rows to disk.
+    
     Args:
         user_id (int): Telegram user ID
         username (str): Telegram username
@@ -186,18 +247,17 @@ def log_user_interaction(user_id, username, first_name, last_name, message_type,
         bool: True if successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(USER_LOGS_DB)
-        c = conn.cursor()
         interaction_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        row = (user_id, username, first_name, last_name, interaction_time, message_type, location, last_interaction)
         
-        c.execute('''
-            INSERT INTO user_logs 
-            (user_id, username, first_name, last_name, interaction_time, message_type, location, last_interaction)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (user_id, username, first_name, last_name, interaction_time, message_type, location, last_interaction))
+        with _log_lock:
+            _log_buffer.append(row)
+            pending = len(_log_buffer)
+            if _log_flusher is None:
+                _start_log_flusher()
         
-        conn.commit()
-        conn.close()
+        if pending >= LOG_FLUSH_ROWS:
+            _log_wakeup.set()
         return True
     except Exception as e:
         logger.error(f"Error logging user interaction: {e}")
@@ -6,7 +6,22 @@ This module handles Telegram bot messages and commands.
 
 import logging
 import json
+import datetime
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from utils.logging import get_logger
+from api.telegram import send_telegram, send_telegram_with_markup
+from core.news_fetcher import (
+    get_compact_news_digest,
+    get_weather_data,
+    fetch_coin_detailed_stats,
+    get_category_news,
+    analyze_news_item,
+)
+from core.advanced_news_fetcher import get_crypto_stats_digest, get_individual_crypto_stats
 from data_modules.models import log_user_interaction
 
 logger = get_logger(__name__)
@@ -14,10 +29,324 @@ logger = get_logger(__name__)
 # In-memory store for news items for [Details] callbacks
 news_item_store = {}
 
+# Worker pool for update handlers; handlers block on Telegram and news/crypto APIs
+UPDATE_WORKERS = 8
+_UPDATE_EXECUTOR = ThreadPoolExecutor(max_workers=UPDATE_WORKERS, thread_name_prefix="update-worker")
+
+# Separate pool for "loading" acknowledgements so they never wait behind
+# (or deadlock against) the update workers that are waiting on them
+_ACK_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ack-sender")
+
+# Cap on queued + running updates; handle_updates blocks (and so stops
+# polling Telegram) while the pool is this far behind
+MAX_PENDING_UPDATES = 64
+_PENDING_UPDATES = threading.BoundedSemaphore(MAX_PENDING_UPDATES)
+
+# Per-chat FIFO of updates waiting to be handled; a chat has an entry only
+# while a worker is draining it
+_CHAT_QUEUES = {}
+_CHAT_QUEUES_LOCK = threading.Lock()
+
+# Static command responses, built once at import
+_START_TEMPLATE = """
+🗞️ *Welcome to ChoyNewsBot, {name}!*
+
+I'm your personal news assistant. I can provide you with:
+• 📰 Latest news updates
+• 🌤️ Weather information
+• 💰 Cryptocurrency market data
+• ⏰ Scheduled news delivery
+
+*Available Commands:*
+/start - Show this welcome message
+/news - Get latest news digest
+/help - Get help and see all commands
+/status - Check bot status
+/about - Learn about ChoyNewsBot features
+
+
+Type /help for more detailed information about what I can do!
+"""
+
+_HELP_MSG = """
+📚 *ChoyNewsBot Commands*
+
+*📰 News & Information:*
+🚀 /start - Initialize the bot and get a welcome message
+📰 /news - Get the compact daily news digest
+🌤️ /weather - Get Dhaka weather information
+👤 /status - Check your subscription status and timezone
+🤖 /server - Check bot server status and uptime
+
+*📰 Category News (10 items each):*
+🇧🇩 /local - Bangladesh local news
+🌍 /global - International global news
+🚀 /tech - Technology and innovation news
+🏆 /sports - Sports news and updates
+💼 /finance - Financial markets and business news
+
+*💰 Cryptocurrency:*
+📊 /cryptostats - Get AI summary of crypto market
+🪙 /coin <symbol> - Get price and 24h change for any coin
+   Examples: /coin btc, /btc, /eth, /pepe, /shib
+📈 /<symbol>stats - Get detailed analysis with technicals, RSI, support/resistance
+   Examples: /btcstats, /ethstats, /pepestats, /shibstats
+📋 /coinstats <symbol> - Same as above, alternative format
+
+*⚙️ Settings & Subscriptions:*
+🕒 /timezone <zone> - Set your timezone for news digest times
+   Examples: /timezone +6, /timezone Asia/Dhaka
+📬 /subscribe - Get news digests automatically at 8am, 1pm, 7pm, 11pm
+📭 /unsubscribe - Stop receiving automatic news digests
+
+*🆘 Support:*
+❓ /help - Show this help message
+ℹ️ /about - Learn about ChoyNewsBot features and capabilities
+🆘 /support - Contact the developer for support
+
+*Popular Crypto Commands:*
+• /btc, /eth, /doge, /ada, /sol, /xrp, /pepe, /shib - Quick price
+• /btcstats, /ethstats, /dogestats, /pepestats - Detailed analysis with technicals, RSI, forecasts
+
+🪙 *Supports 17,500+ coins from CoinGecko!* Try any coin symbol like /pepe, /shib, /link, /uni, etc.
+📊 *Add 'stats' for detailed analysis:* /pepestats, /shibstats, /linkstats, etc.
+
+All times are shown in your local timezone. Use /timezone to set yours!
+"""
+
+_STATUS_MSG = """
+👤 *Your Account Status*
+
+📬 **Subscription Status:** Active (Demo)
+🕒 **Your Timezone:** Asia/Dhaka (UTC+6) 
+📅 **Auto Digest Schedule:**
+   • Morning: 8:00 AM
+   • Midday: 1:00 PM  
+   • Evening: 7:00 PM
+   • Night: 11:00 PM
+
+🔧 **Available Commands:**
+   • `/news` - Get latest news digest
+   • `/weather` - Current weather in Dhaka
+   • `/cryptostats` - Crypto market overview
+   • `/timezone <zone>` - Change your timezone
+   • `/unsubscribe` - Stop auto digests
+
+Type `/help` for more commands.
+"""
+
+_SERVER_TEMPLATE = """
+🤖 **BOT STATUS**
+🕒 Current time: {current_time}
+✅ Bot is online and running
+📡 API connection: Active
+🔧 Services: Bot + Auto News
+
+All systems operational! 🚀
+"""
+
+# Last rendered /server message as (timestamp, text)
+_server_message = ("", "")
+
+_SUBSCRIBE_MSG = """
+📬 *News Subscription Activated!*
+
+You will now receive news digests at:
+🌅 8:00 AM - Morning digest
+🌞 1:00 PM - Midday digest  
+🌆 7:00 PM - Evening digest
+🌙 11:00 PM - Night digest
+
+All times are in your local timezone. Set your timezone with `/timezone <zone>` if needed.
+
+Use `/unsubscribe` to stop receiving automatic digests anytime.
+
+Database integration coming soon!
+"""
+
+_UNSUBSCRIBE_MSG = """
+📭 *News Subscription Cancelled*
+
+You will no longer receive automatic news digests.
+
+You can still get news anytime by using `/news` command.
+
+To reactivate automatic digests, use `/subscribe`.
+
+Database integration coming soon!
+"""
+
+_TIMEZONE_USAGE_MSG = """
+🕒 *Set Your Timezone*
+
+Usage: `/timezone <zone>`
+
+Examples:
+• `/timezone Asia/Dhaka`
+• `/timezone +6`
+• `/timezone Europe/London`
+• `/timezone America/New_York`
+
+This ensures you receive news digests at the correct local times (8am, 1pm, 7pm, 11pm).
+
+Current timezone: UTC+6 (default)
+"""
+
+_TIMEZONE_UPDATED_TEMPLATE = """
+🕒 *Timezone Updated*
+
+Your timezone has been set to: `{timezone_arg}`
+
+News digests will now be delivered at:
+🌅 8:00 AM your time
+🌞 1:00 PM your time
+🌆 7:00 PM your time  
+🌙 11:00 PM your time
+
+Database integration coming soon!
+"""
+
+_SUPPORT_MSG = """
+🆘 *Support & Contact*
+
+For help, feedback, or bug reports:
+
+👨‍💻 *Developer:* Shanchoy Noor
+� *Message:* @shanchoynoor
+�📧 *Email:* shanchoyzone@gmail.com
+🐛 *Issues:* Report bugs via telegarm or email
+
+*Common Issues:*
+• News not loading: Check your internet connection
+• Wrong timezone: Use `/timezone` to set correct zone
+• Missing features: Many features are still in development
+
+*Bot Status:* Active development
+*Version:* v2.0.0
+
+Thank you for using ChoyNewsBot! 🚀
+"""
+
+_ABOUT_FALLBACK_MSG = """
+🤖 *ChoyNewsBot*
+_AI-Powered Breaking News & Crypto Intelligence_
+
+I'm an advanced Telegram news bot that provides:
+• 📰 Real-time breaking news from 50+ sources
+• 🤖 AI-powered crypto analysis with DeepSeek
+• 🌤️ Live weather and market data
+• ⏰ Smart scheduling with zero duplicate news
+
+Type /help to explore all my features!
+
+*Developer:* Shanchoy Noor
+*Contact:* @shanchoynoor
+"""
+
+# Bot information shown by /about, rendered once on first use
+_MEMORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "memory.json")
+_ABOUT_CACHE = None
+_ABOUT_LOCK = threading.Lock()
+
+# Intent keywords for regular (non-command) messages, in priority order
+GREETING_WORDS = frozenset({"hello", "hi", "hey", "greetings"})
+NEWS_WORDS = frozenset({"news", "update", "latest"})
+HELP_WORDS = frozenset({"help", "what", "how"})
+THANKS_WORDS = frozenset({"thanks", "thank you", "thx"})
+
+_INTENT_KEYWORDS = (
+    ("greet", GREETING_WORDS),
+    ("news", NEWS_WORDS),
+    ("help", HELP_WORDS),
+    ("thanks", THANKS_WORDS),
+)
+_INTENT_PRIORITY = {category: rank for rank, (category, _) in enumerate(_INTENT_KEYWORDS)}
+
+# One zero-width lookahead per position so overlapping keywords are all seen
+# in a single scan of the message; named groups tell us the category.
+_INTENT_RE = re.compile("(?=(?:" + "|".join(
+    "(?P<%s>%s)" % (category, "|".join(map(re.escape, sorted(words))))
+    for category, words in _INTENT_KEYWORDS
+) + "))")
+
+# Canned replies per intent; greetings are personalised with the username
+_GREETING_TEMPLATE = "Hello {name}! 👋 Welcome to ChoyNewsBot. Type /help to see what I can do for you!"
+_INTENT_RESPONSES = {
+    "news": "📰 You can get the latest news by typing /news",
+    "help": "❓ Type /help to see all available commands and features",
+    "thanks": "You're welcome! 😊 Happy to help!",
+}
+
+def _match_intent(text_lower):
+    """Return the highest-priority intent category found in text, or None."""
+    best = None
+    for match in _INTENT_RE.finditer(text_lower):
+        category = match.lastgroup
+        if best is None or _INTENT_PRIORITY[category] < _INTENT_PRIORITY[best]:
+            best = category
+            if _INTENT_PRIORITY[best] == 0:
+                break
+    return best
+
+def _send_ack(message, chat_id):
+    """
+    Send a "loading" acknowledgement without blocking the handler.
+    
+    The handler starts its upstream fetch straight away and calls
+    ``.result()`` on the returned future before sending the answer, so the
+    acknowledgement still arrives first.
+    
+    Returns:
+        Future: Resolves to the send_telegram result
+    """
+    return _ACK_EXECUTOR.submit(send_telegram, message, chat_id)
+
+def _dispatch_update(update):
+    """Route a single Telegram update to the handler for its type."""
+    for update_type, handler in _UPDATE_HANDLERS.items():
+        payload = update.get(update_type)
+        if payload is not None:
+            return handler(payload)
+
+def _update_chat_id(update):
+    """Return the chat an update belongs to, or None if it has none."""
+    if "message" in update:
+        return update["message"].get("chat", {}).get("id")
+    if "callback_query" in update:
+        return update["callback_query"].get("message", {}).get("chat", {}).get("id")
+    return None
+
+def _drain_chat(chat_id):
+    """Handle the queued updates of one chat, in the order they arrived."""
+    with _CHAT_QUEUES_LOCK:
+        queue = _CHAT_QUEUES[chat_id]
+    
+    while True:
+        with _CHAT_QUEUES_LOCK:
+            if not queue:
+                # Nothing left: drop the queue so the next update starts a new drain
+                del _CHAT_QUEUES[chat_id]
+                return
+            update = queue.popleft()
+        
+        try:
+            _dispatch_update(update)
+        except Exception as e:
+            logger.error("Error handling update: %s", e, exc_info=True)
+        finally:
+            _PENDING_UPDATES.release()
+
 def handle_updates(updates):
     """
     Process Telegram update objects and handle messages/commands.
     
+    Updates are queued per chat and each chat's queue is drained on the
+    worker pool. A slow command (e.g. /news building a digest) only delays
+    later updates from the same chat, which are still handled in order,
+    while other chats carry on. When MAX_PENDING_UPDATES are already
+    pending this call blocks until one finishes, which in turn slows down
+    polling. Updates without a message or callback query are skipped.
+    
     Args:
         updates (list): List of Telegram update objects
         
@@ -27,20 +356,23 @@ def handle_updates(updates):
     if not updates:
         return None
         
-    last_update_id = None
+    # Telegram returns updates in ascending update_id order
+    last_update_id = updates[-1].get("update_id")
     
     for update in updates:
-        last_update_id = update.get("update_id")
-        
-        # Handle message updates
-        if "message" in update:
-            message = update["message"]
-            handle_message(message)
-            
-        # Handle callback query updates (inline keyboard buttons)
-        elif "callback_query" in update:
-            callback_query = update["callback_query"]
-            handle_callback_query(callback_query)
+        # Updates get_updates reduced to their update_id only advance the offset
+        if "message" not in update and "callback_query" not in update:
+            continue
+        _PENDING_UPDATES.acquire()
+        chat_id = _update_chat_id(update)
+        with _CHAT_QUEUES_LOCK:
+            queue = _CHAT_QUEUES.get(chat_id)
+            if queue is not None:
+                # A worker is already draining this chat; it will pick this up
+                queue.append(update)
+                continue
+            _CHAT_QUEUES[chat_id] = deque((update,))
+        _UPDATE_EXECUTOR.submit(_drain_chat, chat_id)
             
     return last_update_id + 1 if last_update_id is not None else None
 
@@ -51,16 +383,21 @@ def handle_message(message):
     Args:
         message (dict): Telegram message object
     """
-    # Extract message data
-    chat_id = message.get("chat", {}).get("id")
-    user_id = message.get("from", {}).get("id")
-    username = message.get("from", {}).get("username")
-    first_name = message.get("from", {}).get("first_name")
-    last_name = message.get("from", {}).get("last_name")
-    text = message.get("text", "")
-    
-    if not text or not chat_id:
+    # Bail out early on non-text messages (photos, stickers, ...)
+    text = message.get("text")
+    chat = message.get("chat")
+    if not text or not chat:
         return
+    chat_id = chat.get("id")
+    if not chat_id:
+        return
+    
+    # Extract sender data
+    sender = message.get("from") or {}
+    user_id = sender.get("id")
+    username = sender.get("username")
+    first_name = sender.get("first_name")
+    last_name = sender.get("last_name")
         
     # Log the interaction
     log_user_interaction(
@@ -69,10 +406,11 @@ def handle_message(message):
         first_name=first_name,
         last_name=last_name,
         message_type="message",
-        last_interaction=text[:100]  # Truncate long messages
+        # Truncate long messages; short ones (the common case) are not copied
+        last_interaction=text if len(text) <= 100 else text[:100]
     )
     
-    logger.info(f"Received message from {username or user_id}: {text[:50]}")
+    logger.info("Received message from %s: %.50s", username or user_id, text)
     
     # Process commands (messages starting with /)
     if text.startswith('/'):
@@ -83,26 +421,76 @@ def handle_message(message):
 
 def handle_regular_message(chat_id, user_id, username, text):
     """Handle regular (non-command) messages."""
-    from api.telegram import send_telegram
     
     # Simple responses to common greetings and questions
     text_lower = text.lower().strip()
+    intent = _match_intent(text_lower)
     
-    if any(greeting in text_lower for greeting in ['hello', 'hi', 'hey', 'greetings']):
+    if intent == "greet":
         name = username or "there"
-        response = f"Hello {name}! 👋 Welcome to ChoyNewsBot. Type /help to see what I can do for you!"
-    elif any(word in text_lower for word in ['news', 'update', 'latest']):
-        response = "📰 You can get the latest news by typing /news"
-    elif any(word in text_lower for word in ['help', 'what', 'how']):
-        response = "❓ Type /help to see all available commands and features"
-    elif any(word in text_lower for word in ['thanks', 'thank you', 'thx']):
-        response = "You're welcome! 😊 Happy to help!"
+        response = _GREETING_TEMPLATE.format(name=name)
     else:
-        ellipsis = "..." if len(text) > 50 else ""
-        response = f"I received your message: '{text[:50]}{ellipsis}'\\n\\nType /help to see what commands I understand!"
+        response = _INTENT_RESPONSES.get(intent)
+        if response is None:
+            ellipsis = "..." if len(text) > 50 else ""
+            response = f"I received your message: '{text[:50]}{ellipsis}'\\n\\nType /help to see what commands I understand!"
     
     send_telegram(response, chat_id)
-    logger.info(f"Responded to regular message from user {user_id}")
+    logger.info("Responded to regular message from user %s", user_id)
+
+# Coin stats commands: '/' + symbol + 'stats'
+_COIN_STATS_RE = re.compile(r'^/([a-z0-9]+)stats$')
+
+# Popular coin price shortcuts (/btc, /eth, ...) resolved without pattern checks
+_POPULAR_COIN_COMMANDS = frozenset({
+    '/btc', '/eth', '/doge', '/ada', '/sol', '/xrp',
+    '/matic', '/dot', '/link', '/uni', '/pepe', '/shib',
+})
+
+# Command names that must never be treated as coin symbols
+_NON_COIN_COMMANDS = frozenset({
+    'start', 'help', 'news', 'weather', 'subscribe', 'unsubscribe',
+    'status', 'cryptostats', 'support', 'about', 'timezone', 'coin', 'coinstats',
+})
+
+# Exact-match command routing; each entry takes
+# (chat_id, user_id, username, first_name, last_name, args)
+_COMMAND_HANDLERS = {
+    '/start': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_start_command(chat_id, user_id, username, first_name, last_name),
+    '/help': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_help_command(chat_id),
+    '/status': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_status_command(chat_id, user_id),
+    '/server': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_server_command(chat_id),
+    '/news': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_news_command(chat_id, user_id, args),
+    '/weather': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_weather_command(chat_id, user_id),
+    '/cryptostats': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_cryptostats_command(chat_id, user_id),
+    '/local': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_category_news_command(chat_id, user_id, 'local'),
+    '/global': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_category_news_command(chat_id, user_id, 'global'),
+    '/tech': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_category_news_command(chat_id, user_id, 'tech'),
+    '/sports': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_category_news_command(chat_id, user_id, 'sports'),
+    '/finance': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_category_news_command(chat_id, user_id, 'finance'),
+    '/subscribe': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_subscribe_command(chat_id, user_id, username, first_name, last_name),
+    '/unsubscribe': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_unsubscribe_command(chat_id, user_id),
+    '/support': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_support_command(chat_id),
+    '/about': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_about_command(chat_id),
+    '/coinstats': lambda chat_id, user_id, username, first_name, last_name, args:
+        handle_coinstats_arg_command(chat_id, user_id, args),
+}
 
 def handle_command(chat_id, user_id, username, first_name, last_name, text):
     """
@@ -116,68 +504,48 @@ def handle_command(chat_id, user_id, username, first_name, last_name, text):
         last_name (str): User's last name
         text (str): Command text
     """
-    # Split the command and arguments
-    parts = text.split(' ', 1)
-    command = parts[0].lower()
-    args = parts[1] if len(parts) > 1 else ""
-    
-    logger.info(f"Processing command: {command} with args: {args[:50]}")
-    
-    # Import here to avoid circular imports
-    from api.telegram import send_telegram
-    
-    # Handle different commands
-    if command == '/start':
-        handle_start_command(chat_id, user_id, username, first_name, last_name)
-    elif command == '/help':
-        handle_help_command(chat_id)
-    elif command == '/status':
-        handle_status_command(chat_id, user_id)
-    elif command == '/server':
-        handle_server_command(chat_id)
-    elif command == '/news':
-        handle_news_command(chat_id, user_id, args)
-    elif command == '/weather':
-        handle_weather_command(chat_id, user_id)
-    elif command == '/cryptostats':
-        handle_cryptostats_command(chat_id, user_id)
-    elif command == '/local':
-        handle_category_news_command(chat_id, user_id, 'local')
-    elif command == '/global':
-        handle_category_news_command(chat_id, user_id, 'global')
-    elif command == '/tech':
-        handle_category_news_command(chat_id, user_id, 'tech')
-    elif command == '/sports':
-        handle_category_news_command(chat_id, user_id, 'sports')
-    elif command == '/finance':
-        handle_category_news_command(chat_id, user_id, 'finance')
-    elif command == '/subscribe':
-        handle_subscribe_command(chat_id, user_id, username, first_name, last_name)
-    elif command == '/unsubscribe':
-        handle_unsubscribe_command(chat_id, user_id)
-    elif command == '/support':
-        handle_support_command(chat_id)
-    elif command == '/about':
-        handle_about_command(chat_id)
-    elif command.startswith('/timezone'):
-        handle_timezone_command(chat_id, user_id, args)
-    elif command.endswith('stats') and len(command) > 6:
-        # Coin stats commands like /btcstats, /ethstats, /pepestats
-        coin_symbol = command[1:-5]  # Remove '/' prefix and 'stats' suffix
-        handle_coinstats_command(chat_id, user_id, coin_symbol)
-    elif command.startswith('/coin'):
+    # Split the command and arguments without building an intermediate list
+    space = text.find(' ')
+    if space < 0:
+        command = text.lower()
+        args = ""
+    else:
+        command = text[:space].lower()
+        args = text[space + 1:]
+    
+    logger.info("Processing command: %s with args: %.50s", command, args)
+    
+    # Exact commands resolve through the dispatch table
+    handler = _COMMAND_HANDLERS.get(command)
+    if handler:
+        return handler(chat_id, user_id, username, first_name, last_name, args)
+    
+    # Most-used coin shortcuts skip the pattern checks below
+    if command in _POPULAR_COIN_COMMANDS:
+        return handle_coin_command(chat_id, user_id, command[1:])
+    
+    # Prefix and coin-symbol commands fall through to pattern checks
+    if command[:9] == '/timezone':
+        return handle_timezone_command(chat_id, user_id, args)
+    
+    # Coin stats commands like /btcstats, /ethstats, /pepestats
+    coin_stats = _COIN_STATS_RE.match(command)
+    if coin_stats:
+        return handle_coinstats_command(chat_id, user_id, coin_stats.group(1))
+    
+    if command[:5] == '/coin':
         # Generic /coin command with argument
-        if args:
-            handle_coin_command(chat_id, user_id, args.strip().lower())
+        coin_arg = args.strip().lower()
+        if coin_arg:
+            handle_coin_command(chat_id, user_id, coin_arg)
         else:
             send_telegram("Please specify a coin symbol. Example: `/coin btc` or use `/btc`", chat_id)
-    elif command.startswith('/') and len(command) > 1:
+    elif command[:1] == '/' and len(command) > 1:
         # Try to handle as coin symbol (e.g., /btc, /eth, /pepe, /shib, etc.)
-        coin_symbol = command[1:]  # Remove the '/' prefix
+        coin_symbol = command[1:]  # Remove the '/' prefix (command is already lowercase)
         
         # Skip known non-coin commands
-        if coin_symbol.lower() in ['start', 'help', 'news', 'weather', 'subscribe', 'unsubscribe', 
-                                  'status', 'cryptostats', 'support', 'about', 'timezone', 'coin']:
+        if coin_symbol in _NON_COIN_COMMANDS:
             # Unknown command
             send_telegram(
                 f"Sorry, I don't understand the command '{command}'. Type /help to see available commands.",
@@ -195,153 +563,58 @@ def handle_command(chat_id, user_id, username, first_name, last_name, text):
 
 def handle_start_command(chat_id, user_id, username, first_name, last_name):
     """Handle the /start command."""
-    from api.telegram import send_telegram
     
     name = first_name or username or "there"
-    welcome_message = f"""
-🗞️ *Welcome to ChoyNewsBot, {name}!*
-
-I'm your personal news assistant. I can provide you with:
-• 📰 Latest news updates
-• 🌤️ Weather information
-• 💰 Cryptocurrency market data
-• ⏰ Scheduled news delivery
-
-*Available Commands:*
-/start - Show this welcome message
-/news - Get latest news digest
-/help - Get help and see all commands
-/status - Check bot status
-/about - Learn about ChoyNewsBot features
-
-
-Type /help for more detailed information about what I can do!
-    """
+    welcome_message = _START_TEMPLATE.format_map({"name": name})
     
     send_telegram(welcome_message, chat_id)
-    logger.info(f"Sent welcome message to user {user_id} ({username})")
+    logger.info("Sent welcome message to user %s (%s)", user_id, username)
 
 def handle_help_command(chat_id):
     """Handle the /help command."""
-    from api.telegram import send_telegram
-    
-    help_message = """
-📚 *ChoyNewsBot Commands*
-
-*📰 News & Information:*
-🚀 /start - Initialize the bot and get a welcome message
-📰 /news - Get the compact daily news digest
-🌤️ /weather - Get Dhaka weather information
-👤 /status - Check your subscription status and timezone
-🤖 /server - Check bot server status and uptime
-
-*📰 Category News (10 items each):*
-🇧🇩 /local - Bangladesh local news
-🌍 /global - International global news
-🚀 /tech - Technology and innovation news
-🏆 /sports - Sports news and updates
-💼 /finance - Financial markets and business news
-
-*💰 Cryptocurrency:*
-📊 /cryptostats - Get AI summary of crypto market
-🪙 /coin <symbol> - Get price and 24h change for any coin
-   Examples: /coin btc, /btc, /eth, /pepe, /shib
-📈 /<symbol>stats - Get detailed analysis with technicals, RSI, support/resistance
-   Examples: /btcstats, /ethstats, /pepestats, /shibstats
-📋 /coinstats <symbol> - Same as above, alternative format
-
-*⚙️ Settings & Subscriptions:*
-🕒 /timezone <zone> - Set your timezone for news digest times
-   Examples: /timezone +6, /timezone Asia/Dhaka
-📬 /subscribe - Get news digests automatically at 8am, 1pm, 7pm, 11pm
-📭 /unsubscribe - Stop receiving automatic news digests
-
-*🆘 Support:*
-❓ /help - Show this help message
-ℹ️ /about - Learn about ChoyNewsBot features and capabilities
-🆘 /support - Contact the developer for support
-
-*Popular Crypto Commands:*
-• /btc, /eth, /doge, /ada, /sol, /xrp, /pepe, /shib - Quick price
-• /btcstats, /ethstats, /dogestats, /pepestats - Detailed analysis with technicals, RSI, forecasts
-
-🪙 *Supports 17,500+ coins from CoinGecko!* Try any coin symbol like /pepe, /shib, /link, /uni, etc.
-📊 *Add 'stats' for detailed analysis:* /pepestats, /shibstats, /linkstats, etc.
-
-All times are shown in your local timezone. Use /timezone to set yours!
-    """
     
-    send_telegram(help_message, chat_id)
-    logger.info(f"Sent help message to chat {chat_id}")
+    send_telegram(_HELP_MSG, chat_id)
+    logger.info("Sent help message to chat %s", chat_id)
 
 def handle_status_command(chat_id, user_id):
     """Handle the /status command - show user subscription status and timezone."""
-    from api.telegram import send_telegram
     
     try:
         # For now, we'll show placeholder info since subscription DB is not fully implemented
         # TODO: Integrate with actual subscription database when implemented
         
-        status_message = f"""
-👤 *Your Account Status*
-
-📬 **Subscription Status:** Active (Demo)
-🕒 **Your Timezone:** Asia/Dhaka (UTC+6) 
-📅 **Auto Digest Schedule:**
-   • Morning: 8:00 AM
-   • Midday: 1:00 PM  
-   • Evening: 7:00 PM
-   • Night: 11:00 PM
-
-🔧 **Available Commands:**
-   • `/news` - Get latest news digest
-   • `/weather` - Current weather in Dhaka
-   • `/cryptostats` - Crypto market overview
-   • `/timezone <zone>` - Change your timezone
-   • `/unsubscribe` - Stop auto digests
-
-Type `/help` for more commands.
-        """
-        
-        send_telegram(status_message, chat_id)
-        logger.info(f"Sent status message to user {user_id}")
+        send_telegram(_STATUS_MSG, chat_id)
+        logger.info("Sent status message to user %s", user_id)
         
     except Exception as e:
-        logger.error(f"Error getting user status for user {user_id}: {e}")
+        logger.error("Error getting user status for user %s: %s", user_id, e)
         send_telegram("Sorry, there was an error retrieving your status. Please try again later.", chat_id)
 
 def handle_server_command(chat_id):
     """Handle the /server command - show server/bot status."""
-    from api.telegram import send_telegram
-    import datetime
+    global _server_message
     
     try:
         current_time = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        status_message = f"""
-🤖 **BOT STATUS**
-🕒 Current time: {current_time}
-✅ Bot is online and running
-📡 API connection: Active
-🔧 Services: Bot + Auto News
-
-All systems operational! 🚀
-        """
+        # The message only changes once a second; reuse it within that second
+        cached = _server_message
+        if cached[0] != current_time:
+            cached = (current_time, _SERVER_TEMPLATE.format(current_time=current_time))
+            _server_message = cached
         
-        send_telegram(status_message, chat_id)
-        logger.info(f"Sent server status message to chat {chat_id}")
+        send_telegram(cached[1], chat_id)
+        logger.info("Sent server status message to chat %s", chat_id)
         
     except Exception as e:
-        logger.error(f"Error getting server status: {e}")
+        logger.error("Error getting server status: %s", e)
         send_telegram("Sorry, there was an error retrieving server status. Please try again later.", chat_id)
 
 def handle_news_command(chat_id, user_id, args):
     """Handle the /news command with compact format and add inline keyboard for category navigation and details."""
-    from api.telegram import send_telegram
-    from core.news_fetcher import get_compact_news_digest
     try:
         # Send loading message
-        send_telegram("📰 Loading latest news...", chat_id)
+        ack = _send_ack("📰 Loading latest news...", chat_id)
         # Build and send compact news digest
         digest, section_data, main_buttons = get_compact_news_digest()
         from telegram import InlineKeyboardButton, InlineKeyboardMarkup
@@ -361,11 +634,11 @@ def handle_news_command(chat_id, user_id, args):
             grid.append(row)
         keyboard.extend(grid)
         reply_markup = InlineKeyboardMarkup(keyboard)
-        from api.telegram import send_telegram_with_markup
+        ack.result()
         send_telegram_with_markup(digest, chat_id, reply_markup)
-        logger.info(f"Sent compact news digest to user {user_id}")
+        logger.info("Sent compact news digest to user %s", user_id)
     except Exception as e:
-        logger.error(f"Error generating compact news digest for user {user_id}: {e}")
+        logger.error("Error generating compact news digest for user %s: %s", user_id, e)
         send_telegram(
             "Sorry, I encountered an error while generating your news digest. Please try again later.",
             chat_id
@@ -397,256 +670,180 @@ def handle_callback_query(callback_query):
         message_type="callback",
         last_interaction=data
     )
-    logger.info(f"Received callback from {username or user_id}: {data}")
-    # Handle category navigation
-    if data in ['/local', '/global', '/tech', '/sports', '/finance', '/cryptostats']:
-        if data == '/cryptostats':
-            handle_cryptostats_command(chat_id, user_id)
-        else:
-            category = data[1:]
-            handle_category_news_command(chat_id, user_id, category)
-        # Optionally, answer the callback to remove the loading spinner
-        try:
-            from api.telegram import answer_callback_query
-            answer_callback_query(query_id)
-        except Exception:
-            pass
-    # Handle [Details] button for news item
-    elif data.startswith('details_'):
-        news_id = data[len('details_'):]
-        item = news_item_store.get(news_id)
-        if item:
-            from core.news_fetcher import analyze_news_item
-            summary = analyze_news_item(item['title'], item['summary'], item['source'])
-            from api.telegram import send_telegram
-            send_telegram(summary, chat_id)
+    logger.info("Received callback from %s: %s", username or user_id, data)
+    # Route on the callback prefix: '/<category>' buttons or 'details_<news id>'
+    route, _, payload = data.partition('_')
+    handler = _CALLBACK_ROUTES.get(route)
+    if handler:
+        handler(chat_id, user_id, payload)
+        # Answer the callback to remove the loading spinner
         try:
             from api.telegram import answer_callback_query
             answer_callback_query(query_id)
         except Exception:
             pass
-    # (You can add more callback handling here if needed)
-    # (No further news or content after this)
+
+# Handlers per Telegram update type, in lookup order (messages are by far the
+# most common); keep in sync with allowed_updates in api.telegram.get_updates
+_UPDATE_HANDLERS = {
+    "message": handle_message,
+    "callback_query": handle_callback_query,
+}
+
+def _handle_details_callback(chat_id, user_id, news_id):
+    """Send an AI summary for the news item behind a [Details] button."""
+    item = news_item_store.get(news_id)
+    if item:
+        summary = analyze_news_item(item['title'], item['summary'], item['source'])
+        send_telegram(summary, chat_id)
+
+# Inline keyboard callback routing, keyed by the part of callback_data before '_'
+_CALLBACK_ROUTES = {
+    '/local': lambda chat_id, user_id, payload: handle_category_news_command(chat_id, user_id, 'local'),
+    '/global': lambda chat_id, user_id, payload: handle_category_news_command(chat_id, user_id, 'global'),
+    '/tech': lambda chat_id, user_id, payload: handle_category_news_command(chat_id, user_id, 'tech'),
+    '/sports': lambda chat_id, user_id, payload: handle_category_news_command(chat_id, user_id, 'sports'),
+    '/finance': lambda chat_id, user_id, payload: handle_category_news_command(chat_id, user_id, 'finance'),
+    '/cryptostats': lambda chat_id, user_id, payload: handle_cryptostats_command(chat_id, user_id),
+    'details': _handle_details_callback,
+}
 
 def handle_weather_command(chat_id, user_id):
     """Handle the /weather command."""
-    from api.telegram import send_telegram
-    from core.news_fetcher import get_weather_data
     
     try:
         # Send loading message first
-        send_telegram("🌤️ Getting latest weather data...", chat_id)
+        ack = _send_ack("🌤️ Getting latest weather data...", chat_id)
         
         # Get weather data
         weather_message = get_weather_data("Dhaka")
+        ack.result()
         send_telegram(weather_message, chat_id)
         
-        logger.info(f"Sent weather info to user {user_id}")
+        logger.info("Sent weather info to user %s", user_id)
         
     except Exception as e:
-        logger.error(f"Error getting weather for user {user_id}: {e}")
+        logger.error("Error getting weather for user %s: %s", user_id, e)
         send_telegram("Sorry, weather information is temporarily unavailable.", chat_id)
 
 def handle_cryptostats_command(chat_id, user_id):
     """Handle the /cryptostats command."""
-    from api.telegram import send_telegram
-    from core.advanced_news_fetcher import get_crypto_stats_digest
     
     try:
-        send_telegram("� Fetching latest crypto market data with AI analysis...", chat_id)
+        ack = _send_ack("� Fetching latest crypto market data with AI analysis...", chat_id)
         
         crypto_section = get_crypto_stats_digest()
+        ack.result()
         if crypto_section:
             send_telegram(crypto_section, chat_id)
         else:
             send_telegram("Sorry, cryptocurrency market data is temporarily unavailable.", chat_id)
         
-        logger.info(f"Sent crypto stats to user {user_id}")
+        logger.info("Sent crypto stats to user %s", user_id)
         
     except Exception as e:
-        logger.error(f"Error getting crypto stats for user {user_id}: {e}")
+        logger.error("Error getting crypto stats for user %s: %s", user_id, e)
         send_telegram("Sorry, cryptocurrency market data is temporarily unavailable.", chat_id)
 
 def handle_coin_command(chat_id, user_id, coin_symbol):
     """Handle coin price commands like /btc, /eth, etc."""
-    from api.telegram import send_telegram
-    from core.advanced_news_fetcher import get_individual_crypto_stats
     
     try:
-        send_telegram(f"🔄 Fetching latest {coin_symbol.upper()} data...", chat_id)
+        ack = _send_ack(f"🔄 Fetching latest {coin_symbol.upper()} data...", chat_id)
         
         coin_data = get_individual_crypto_stats(coin_symbol)
+        ack.result()
         if coin_data:
             send_telegram(coin_data, chat_id)
         else:
             send_telegram(f"Sorry, I couldn't find '{coin_symbol.upper()}' on CoinGecko. Please check the symbol and try again. Example: `/pepe` for PEPE, `/btc` for Bitcoin.", chat_id)
         
-        logger.info(f"Sent {coin_symbol} price to user {user_id}")
+        logger.info("Sent %s price to user %s", coin_symbol, user_id)
         
     except Exception as e:
-        logger.error(f"Error getting {coin_symbol} price for user {user_id}: {e}")
+        logger.error("Error getting %s price for user %s: %s", coin_symbol, user_id, e)
         send_telegram(f"Sorry, I couldn't get price data for {coin_symbol.upper()}.", chat_id)
 
 def handle_coinstats_command(chat_id, user_id, coin_symbol):
     """Handle coin stats commands like /btcstats, /ethstats, /pepestats, etc."""
-    from api.telegram import send_telegram
-    from core.news_fetcher import fetch_coin_detailed_stats
     
     try:
-        send_telegram(f"🔄 Analyzing {coin_symbol.upper()} with advanced analytics...", chat_id)
+        ack = _send_ack(f"🔄 Analyzing {coin_symbol.upper()} with advanced analytics...", chat_id)
         
         # Use the new detailed analysis function
         coin_analysis = fetch_coin_detailed_stats(coin_symbol)
+        ack.result()
         send_telegram(coin_analysis, chat_id)
         
-        logger.info(f"Sent {coin_symbol} detailed stats to user {user_id}")
+        logger.info("Sent %s detailed stats to user %s", coin_symbol, user_id)
         
     except Exception as e:
-        logger.error(f"Error getting {coin_symbol} detailed stats for user {user_id}: {e}")
+        logger.error("Error getting %s detailed stats for user %s: %s", coin_symbol, user_id, e)
         send_telegram(f"Sorry, I couldn't get detailed stats for {coin_symbol.upper()}. Please try again later.", chat_id)
 
+def handle_coinstats_arg_command(chat_id, user_id, args):
+    """Handle the /coinstats <symbol> form of the coin stats command."""
+    coin_symbol = args.strip().lower()
+    if coin_symbol:
+        handle_coinstats_command(chat_id, user_id, coin_symbol)
+    else:
+        send_telegram("Please specify a coin symbol. Example: `/coinstats btc` or use `/btcstats`", chat_id)
+
 def handle_subscribe_command(chat_id, user_id, username, first_name, last_name):
     """Handle the /subscribe command."""
-    from api.telegram import send_telegram
     
     try:
         # This would integrate with the subscription database
-        subscribe_message = """
-📬 *News Subscription Activated!*
-
-You will now receive news digests at:
-🌅 8:00 AM - Morning digest
-🌞 1:00 PM - Midday digest  
-🌆 7:00 PM - Evening digest
-🌙 11:00 PM - Night digest
-
-All times are in your local timezone. Set your timezone with `/timezone <zone>` if needed.
-
-Use `/unsubscribe` to stop receiving automatic digests anytime.
-
-Database integration coming soon!
-        """
-        
-        send_telegram(subscribe_message, chat_id)
-        logger.info(f"User {user_id} ({username}) subscribed to news digests")
+        send_telegram(_SUBSCRIBE_MSG, chat_id)
+        logger.info("User %s (%s) subscribed to news digests", user_id, username)
         
     except Exception as e:
-        logger.error(f"Error subscribing user {user_id}: {e}")
+        logger.error("Error subscribing user %s: %s", user_id, e)
         send_telegram("Sorry, there was an error setting up your subscription. Please try again later.", chat_id)
 
 def handle_unsubscribe_command(chat_id, user_id):
     """Handle the /unsubscribe command."""
-    from api.telegram import send_telegram
     
     try:
-        unsubscribe_message = """
-📭 *News Subscription Cancelled*
-
-You will no longer receive automatic news digests.
-
-You can still get news anytime by using `/news` command.
-
-To reactivate automatic digests, use `/subscribe`.
-
-Database integration coming soon!
-        """
-        
-        send_telegram(unsubscribe_message, chat_id)
-        logger.info(f"User {user_id} unsubscribed from news digests")
+        send_telegram(_UNSUBSCRIBE_MSG, chat_id)
+        logger.info("User %s unsubscribed from news digests", user_id)
         
     except Exception as e:
-        logger.error(f"Error unsubscribing user {user_id}: {e}")
+        logger.error("Error unsubscribing user %s: %s", user_id, e)
         send_telegram("Sorry, there was an error cancelling your subscription. Please try again later.", chat_id)
 
 def handle_timezone_command(chat_id, user_id, timezone_arg):
     """Handle the /timezone command."""
-    from api.telegram import send_telegram
     
     try:
         if not timezone_arg:
-            timezone_message = """
-🕒 *Set Your Timezone*
-
-Usage: `/timezone <zone>`
-
-Examples:
-• `/timezone Asia/Dhaka`
-• `/timezone +6`
-• `/timezone Europe/London`
-• `/timezone America/New_York`
-
-This ensures you receive news digests at the correct local times (8am, 1pm, 7pm, 11pm).
-
-Current timezone: UTC+6 (default)
-            """
+            timezone_message = _TIMEZONE_USAGE_MSG
         else:
             # This would validate and set the timezone in database
-            timezone_message = f"""
-🕒 *Timezone Updated*
-
-Your timezone has been set to: `{timezone_arg}`
-
-News digests will now be delivered at:
-🌅 8:00 AM your time
-🌞 1:00 PM your time
-🌆 7:00 PM your time  
-🌙 11:00 PM your time
-
-Database integration coming soon!
-            """
+            timezone_message = _TIMEZONE_UPDATED_TEMPLATE.format(timezone_arg=timezone_arg)
         
         send_telegram(timezone_message, chat_id)
-        logger.info(f"Timezone command for user {user_id}: {timezone_arg}")
+        logger.info("Timezone command for user %s: %s", user_id, timezone_arg)
         
     except Exception as e:
-        logger.error(f"Error setting timezone for user {user_id}: {e}")
+        logger.error("Error setting timezone for user %s: %s", user_id, e)
         send_telegram("Sorry, there was an error setting your timezone. Please try again later.", chat_id)
 
 def handle_support_command(chat_id):
     """Handle the /support command."""
-    from api.telegram import send_telegram
     
-    support_message = """
-🆘 *Support & Contact*
-
-For help, feedback, or bug reports:
-
-👨‍💻 *Developer:* Shanchoy Noor
-� *Message:* @shanchoynoor
-�📧 *Email:* shanchoyzone@gmail.com
-🐛 *Issues:* Report bugs via telegarm or email
-
-*Common Issues:*
-• News not loading: Check your internet connection
-• Wrong timezone: Use `/timezone` to set correct zone
-• Missing features: Many features are still in development
-
-*Bot Status:* Active development
-*Version:* v2.0.0
+    send_telegram(_SUPPORT_MSG, chat_id)
+    logger.info("Sent support info to chat %s", chat_id)
 
-Thank you for using ChoyNewsBot! 🚀
-    """
+def _build_about_message():
+    """Render the /about message from data/memory.json."""
+    with open(_MEMORY_FILE, 'r', encoding='utf-8') as f:
+        bot_data = json.load(f)
     
-    send_telegram(support_message, chat_id)
-    logger.info(f"Sent support info to chat {chat_id}")
-
-def handle_about_command(chat_id):
-    """Handle the /about command."""
-    from api.telegram import send_telegram
-    import json
-    import os
+    bot_info = bot_data["bot_info"]
     
-    try:
-        # Load bot information from memory.json
-        memory_file = os.path.join(os.path.dirname(__file__), "..", "..", "data", "memory.json")
-        
-        with open(memory_file, 'r', encoding='utf-8') as f:
-            bot_data = json.load(f)
-        
-        bot_info = bot_data["bot_info"]
-        
-        # Build the about message
-        about_message = f"""
+    # Build the about message
+    about_message = f"""
 🤖 *{bot_info["name"]}*
 _{bot_info["tagline"]}_
 
@@ -658,25 +855,25 @@ _{bot_info["tagline"]}_
 {bot_info["what_makes_special"]["title"]}
 
 """
-        
-        # Add special features
-        for feature in bot_info["what_makes_special"]["features"]:
-            about_message += f"• {feature}\n"
-        
-        about_message += f"\n{bot_info['core_features']['title']}\n\n"
-        
-        # Add core feature sections
-        for section in bot_info["core_features"]["sections"]:
-            about_message += f"*{section['title']}*\n"
-            about_message += f"{section['description']}\n\n"
-            
-            for feature in section["features"]:
-                about_message += f"{feature}\n"
-            about_message += "\n"
-        
-        # Add statistics
-        stats = bot_info["statistics"]
-        about_message += f"""
+    
+    # Add special features
+    for feature in bot_info["what_makes_special"]["features"]:
+        about_message += f"• {feature}\n"
+    
+    about_message += f"\n{bot_info['core_features']['title']}\n\n"
+    
+    # Add core feature sections
+    for section in bot_info["core_features"]["sections"]:
+        about_message += f"*{section['title']}*\n"
+        about_message += f"{section['description']}\n\n"
+        
+        for feature in section["features"]:
+            about_message += f"{feature}\n"
+        about_message += "\n"
+    
+    # Add statistics
+    stats = bot_info["statistics"]
+    about_message += f"""
 *📊 Key Statistics:*
 • News Sources: {stats["news_sources"]} premium outlets
 • Update Frequency: {stats["update_frequency"]}
@@ -692,35 +889,30 @@ _{bot_info["tagline"]}_
 
 *🚀 Ready to get started?*
 Type /help to see all available commands!
-        """
+    """
+    return about_message
+
+def handle_about_command(chat_id):
+    """Handle the /about command."""
+    global _ABOUT_CACHE
+    
+    try:
+        # memory.json is static, so render it once and reuse the result
+        if _ABOUT_CACHE is None:
+            with _ABOUT_LOCK:
+                if _ABOUT_CACHE is None:
+                    _ABOUT_CACHE = _build_about_message()
         
-        send_telegram(about_message, chat_id)
-        logger.info(f"Sent about info to chat {chat_id}")
+        send_telegram(_ABOUT_CACHE, chat_id)
+        logger.info("Sent about info to chat %s", chat_id)
         
     except Exception as e:
-        logger.error(f"Error loading about info: {e}")
+        logger.error("Error loading about info: %s", e)
         # Fallback message
-        fallback_message = """
-🤖 *ChoyNewsBot*
-_AI-Powered Breaking News & Crypto Intelligence_
-
-I'm an advanced Telegram news bot that provides:
-• 📰 Real-time breaking news from 50+ sources
-• 🤖 AI-powered crypto analysis with DeepSeek
-• 🌤️ Live weather and market data
-• ⏰ Smart scheduling with zero duplicate news
-
-Type /help to explore all my features!
-
-*Developer:* Shanchoy Noor
-*Contact:* @shanchoynoor
-        """
-        send_telegram(fallback_message, chat_id)
+        send_telegram(_ABOUT_FALLBACK_MSG, chat_id)
 
 def handle_category_news_command(chat_id, user_id, category):
     """Handle category-specific news commands (/local, /global, /tech, /sports, /finance) with [Details] inline buttons."""
-    from api.telegram import send_telegram
-    from core.news_fetcher import get_category_news
     try:
         # Send loading message
         category_names = {
@@ -731,7 +923,7 @@ def handle_category_news_command(chat_id, user_id, category):
             'finance': 'finance'
         }
         category_name = category_names.get(category, category)
-        send_telegram(f"📰 Loading {category_name} news...", chat_id)
+        ack = _send_ack(f"📰 Loading {category_name} news...", chat_id)
         # Get category news and news_items for [Details]
         news_message, news_items = get_category_news(category, limit=10)
         # Build inline keyboard with [Details] button for each news item
@@ -742,14 +934,14 @@ def handle_category_news_command(chat_id, user_id, category):
             news_item_store[item['id']] = item
             keyboard.append([InlineKeyboardButton("[Details]", callback_data=f"details_{item['id']}")])
         reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
-        from api.telegram import send_telegram_with_markup
+        ack.result()
         if reply_markup:
             send_telegram_with_markup(news_message, chat_id, reply_markup)
         else:
             send_telegram(news_message, chat_id)
-        logger.info(f"Sent {category} news to user {user_id}")
+        logger.info("Sent %s news to user %s", category, user_id)
     except Exception as e:
-        logger.error(f"Error getting {category} news for user {user_id}: {e}")
+        logger.error("Error getting %s news for user %s: %s", category, user_id, e)
         send_telegram(
             f"Sorry, I encountered an error while fetching {category} news. Please try again later.",
             chat_id
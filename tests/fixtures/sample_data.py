@@ -34,6 +34,61 @@ SAMPLE_RSS_FEED = '''<?xml version="1.0" encoding="UTF-8"?>
     </channel>
 </rss>'''
 
+# Sample Atom feed response
+SAMPLE_ATOM_FEED = '''<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <title>Test Atom Feed</title>
+    <updated>2025-07-12T10:00:00Z</updated>
+    <entry>
+        <title>Ethereum upgrade goes live on mainnet</title>
+        <link rel="replies" href="https://example.com/atom-1/comments"/>
+        <link rel="alternate" href="https://example.com/atom-1"/>
+        <id>atom-1</id>
+        <published>2025-07-12T10:00:00Z</published>
+        <updated>2025-07-12T11:00:00Z</updated>
+    </entry>
+    <entry>
+        <title>Parliament passes budget after long debate</title>
+        <link href="https://example.com/atom-2"/>
+        <id>atom-2</id>
+        <updated>2025-07-12T09:30:00+06:00</updated>
+    </entry>
+</feed>'''
+
+# Sample RSS 1.0 (RDF) feed response
+SAMPLE_RDF_FEED = '''<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <channel rdf:about="https://example.com/">
+        <title>Test RDF Feed</title>
+        <link>https://example.com/</link>
+    </channel>
+    <item rdf:about="https://example.com/rdf-1">
+        <title>Flood warning issued for northern districts</title>
+        <link>https://example.com/rdf-1</link>
+        <dc:date>2025-07-12T08:00:00Z</dc:date>
+    </item>
+    <item rdf:about="https://example.com/rdf-2">
+        <title>Court verdict expected in landmark case</title>
+        <link>https://example.com/rdf-2</link>
+        <dc:date>2025-07-12T07:00:00Z</dc:date>
+    </item>
+</rdf:RDF>'''
+
+# RSS feed with an unescaped ampersand, which strict XML parsers reject
+MALFORMED_RSS_FEED = '''<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Broken Feed</title>
+        <item>
+            <title>Stocks & bonds rally after rate decision</title>
+            <link>https://example.com/broken-1</link>
+            <pubDate>Fri, 12 Jul 2025 10:00:00 GMT</pubDate>
+        </item>
+    </channel>
+</rss>'''
+
 # Sample crypto market data
 SAMPLE_CRYPTO_DATA = {
     "bitcoin": {
@@ -146,6 +201,18 @@ def get_sample_rss_feed():
     """Return sample RSS feed for testing."""
     return SAMPLE_RSS_FEED
 
+def get_sample_atom_feed():
+    """Return sample Atom feed for testing."""
+    return SAMPLE_ATOM_FEED
+
+def get_sample_rdf_feed():
+    """Return sample RSS 1.0 (RDF) feed for testing."""
+    return SAMPLE_RDF_FEED
+
+def get_malformed_rss_feed():
+    """Return an RSS feed that is not well-formed XML."""
+    return MALFORMED_RSS_FEED
+
 def get_sample_crypto_data():
     """Return sample cryptocurrency data."""
     return SAMPLE_CRYPTO_DATA
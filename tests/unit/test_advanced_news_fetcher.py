@@ -0,0 +1,163 @@
+"""
+Tests for feed parsing and news scoring in core.advanced_news_fetcher.
+"""
+import re
+import time
+
+import pytest
+
+from core.advanced_news_fetcher import (
+    SOURCE_WEIGHTS,
+    _KEYWORD_GROUPS,
+    _parse_feed_entries,
+    calculate_news_importance_score,
+)
+from tests.fixtures.sample_data import (
+    get_malformed_rss_feed,
+    get_sample_atom_feed,
+    get_sample_rdf_feed,
+    get_sample_rss_feed,
+)
+
+
+def _parse(feed, limit=10):
+    return _parse_feed_entries(feed.encode("utf-8"), limit)
+
+
+class TestParseFeedEntries:
+    def test_rss(self):
+        entries = _parse(get_sample_rss_feed())
+        assert [entry["link"] for entry in entries] == [
+            "https://example.com/crypto-news-1",
+            "https://example.com/bd-news-1",
+            "https://example.com/tech-news-1",
+        ]
+        assert entries[0] == {
+            "title": "Bitcoin reaches new heights amid institutional adoption",
+            "link": "https://example.com/crypto-news-1",
+            "published": "Fri, 12 Jul 2025 10:00:00 GMT",
+        }
+
+    def test_atom_prefers_alternate_link_and_published_date(self):
+        entries = _parse(get_sample_atom_feed())
+        assert entries == [
+            {
+                "title": "Ethereum upgrade goes live on mainnet",
+                "link": "https://example.com/atom-1",
+                "published": "2025-07-12T10:00:00Z",
+            },
+            {
+                "title": "Parliament passes budget after long debate",
+                "link": "https://example.com/atom-2",
+                "published": "2025-07-12T09:30:00+06:00",
+            },
+        ]
+
+    def test_rdf_items_use_dublin_core_date(self):
+        entries = _parse(get_sample_rdf_feed())
+        assert entries == [
+            {
+                "title": "Flood warning issued for northern districts",
+                "link": "https://example.com/rdf-1",
+                "published": "2025-07-12T08:00:00Z",
+            },
+            {
+                "title": "Court verdict expected in landmark case",
+                "link": "https://example.com/rdf-2",
+                "published": "2025-07-12T07:00:00Z",
+            },
+        ]
+
+    def test_stops_after_limit(self):
+        entries = _parse(get_sample_rss_feed(), limit=2)
+        assert [entry["link"] for entry in entries] == [
+            "https://example.com/crypto-news-1",
+            "https://example.com/bd-news-1",
+        ]
+
+    def test_malformed_xml_falls_back_to_feedparser(self):
+        entries = _parse(get_malformed_rss_feed())
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["title"] == "Stocks & bonds rally after rate decision"
+        assert entry["link"] == "https://example.com/broken-1"
+        assert entry["published"] == "Fri, 12 Jul 2025 10:00:00 GMT"
+        # Only the feedparser path carries its parsed struct_time
+        assert isinstance(entry["published_parsed"], time.struct_time)
+        assert entry["published_parsed"][:6] == (2025, 7, 12, 10, 0, 0)
+
+    def test_unparseable_body_returns_no_entries(self):
+        assert _parse("not a feed at all") == []
+
+
+# The per-keyword scoring that the single-pass _KEYWORD_RE replaced; the new
+# scorer must give the same results
+_OLD_BREAKING_RE = re.compile('|'.join(map(re.escape, [
+    'breaking', 'urgent', 'alert', 'emergency', 'crisis', 'live',
+    'developing', 'update', 'latest', 'just in', 'confirmed',
+    'exclusive', 'major', 'significant', 'important', 'critical'])))
+_OLD_IMPACT_RES = [
+    (re.compile('|'.join(map(re.escape, keywords))), weight)
+    for keywords, weight in (
+        (['death', 'killed', 'murder', 'accident', 'disaster',
+          'earthquake', 'flood', 'fire', 'explosion', 'crash'], 8),
+        (['election', 'government', 'minister', 'president',
+          'prime minister', 'parliament', 'court', 'verdict'], 7),
+        (['bitcoin', 'crypto', 'blockchain', 'ethereum',
+          'market crash', 'surge', 'rally', 'all-time high'], 6),
+        (['war', 'conflict', 'attack', 'bombing', 'invasion',
+          'ceasefire', 'peace', 'treaty'], 9),
+        (['ai', 'artificial intelligence', 'chatgpt', 'openai',
+          'launch', 'release', 'breakthrough', 'innovation'], 5),
+    )
+]
+
+
+def _old_score(entry, source_name, feed_position):
+    title = entry.get('title', '').lower()
+    score = max(0, 10 - feed_position) + SOURCE_WEIGHTS.get(source_name, 5)
+    score += 5 * len(set(_OLD_BREAKING_RE.findall(title)))
+    for pattern, weight in _OLD_IMPACT_RES:
+        if pattern.search(title):
+            score += weight
+    return score
+
+
+SAMPLE_HEADLINES = [
+    "BREAKING: Earthquake kills dozens, emergency declared",
+    "Market crash wipes out crypto gains as Bitcoin slides",
+    "Live updates: Prime Minister addresses parliament on election date",
+    "Ceasefire talks collapse after bombing; latest developments",
+    "OpenAI launches ChatGPT upgrade in major AI release",
+    "Court verdict confirmed in exclusive murder case",
+    "Ethereum hits all-time high amid rally and surge in blockchain use",
+    "Fire crews respond to explosion at warehouse",
+    "Critical update: urgent alert issued for flood-hit districts",
+    "Just in: president signs peace treaty ending war",
+    "Significant breakthrough in artificial intelligence research",
+    "Important innovation delivered by local startup",
+    "Weather remains mild across the region",
+    "Cricket: Bangladesh beat Sri Lanka by five wickets",
+    "",
+]
+
+
+class TestNewsImportanceScore:
+    @pytest.mark.parametrize("title", SAMPLE_HEADLINES)
+    @pytest.mark.parametrize("source_name, feed_position", [("BBC", 0), ("Unknown Source", 3), ("Reuters", 12)])
+    def test_matches_per_keyword_scoring(self, title, source_name, feed_position):
+        entry = {"title": title}
+        assert (calculate_news_importance_score(entry, source_name, feed_position)
+                == _old_score(entry, source_name, feed_position))
+
+    def test_overlapping_keywords_count_for_each_group(self):
+        # "market crash" is crypto (6) and contains disaster's "crash" (8)
+        entry = {"title": "market crash"}
+        base = calculate_news_importance_score({"title": "quiet day"}, "BBC", 0)
+        assert calculate_news_importance_score(entry, "BBC", 0) == base + 6 + 8
+
+    def test_no_keyword_is_a_prefix_of_another(self):
+        # The single alternation relies on this: a keyword that prefixed a
+        # longer one would be hidden behind it at the same position
+        keywords = list(_KEYWORD_GROUPS)
+        assert not [(a, b) for a in keywords for b in keywords if a != b and b.startswith(a)]
@@ -0,0 +1,192 @@
+"""
+Tests for the TTL cache utilities in utils.cache.
+"""
+import threading
+import time
+
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import TTLCache, ttl_cache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic with a manually advanced clock."""
+    class Clock:
+        now = 1000.0
+
+        def __call__(self):
+            return self.now
+
+        def advance(self, seconds):
+            self.now += seconds
+
+    fake = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self, clock):
+        cache = TTLCache()
+        cache.set("a", 1, ttl=10)
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    def test_entries_expire(self, clock):
+        cache = TTLCache()
+        cache.set("a", 1, ttl=10)
+        clock.advance(9.9)
+        assert cache.get("a") == 1
+        clock.advance(0.1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=10)
+        cache.get("a")
+        cache.set("c", 3, ttl=10)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_clear(self, clock):
+        cache = TTLCache()
+        cache.set("a", 1, ttl=10)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestTTLCacheDecorator:
+    def test_caches_until_ttl_expires(self, clock):
+        calls = []
+
+        @ttl_cache(ttl=10)
+        def fetch(x):
+            calls.append(x)
+            return x * 2
+
+        assert fetch(2) == 4
+        assert fetch(2) == 4
+        assert calls == [2]
+        clock.advance(10)
+        assert fetch(2) == 4
+        assert calls == [2, 2]
+
+    def test_keys_on_args_and_kwargs(self, clock):
+        calls = []
+
+        @ttl_cache(ttl=10)
+        def fetch(x, scale=1):
+            calls.append((x, scale))
+            return x * scale
+
+        fetch(2)
+        fetch(2, scale=3)
+        fetch(2, scale=3)
+        fetch(3)
+        assert calls == [(2, 1), (2, 3), (3, 1)]
+
+    def test_evicts_least_recently_used(self, clock):
+        calls = []
+
+        @ttl_cache(ttl=10, maxsize=2)
+        def fetch(x):
+            calls.append(x)
+            return x
+
+        fetch(1)
+        fetch(2)
+        fetch(1)
+        fetch(3)  # evicts 2, the least recently used
+        fetch(1)
+        assert calls == [1, 2, 3]
+        fetch(2)
+        assert calls == [1, 2, 3, 2]
+
+    def test_exceptions_are_not_cached(self, clock):
+        calls = []
+
+        @ttl_cache(ttl=10)
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("upstream down")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            fetch()
+        assert fetch() == "ok"
+        assert fetch() == "ok"
+        assert len(calls) == 2
+
+    def test_cache_if_rejects_results(self, clock):
+        results = iter(["fallback", "fresh", "later"])
+
+        @ttl_cache(ttl=10, cache_if=lambda value: value != "fallback")
+        def fetch():
+            return next(results)
+
+        assert fetch() == "fallback"
+        assert fetch() == "fresh"
+        assert fetch() == "fresh"
+
+    def test_cache_clear(self, clock):
+        calls = []
+
+        @ttl_cache(ttl=10)
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert fetch() == 1
+        fetch.cache_clear()
+        assert fetch() == 2
+
+    def test_concurrent_misses_are_coalesced(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @ttl_cache(ttl=60)
+        def fetch(x):
+            calls.append(x)
+            started.set()
+            release.wait(5)
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(fetch(21))) for _ in range(8)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        # Give the waiting callers time to block on the in-flight call
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == [42] * 8
+        assert calls == [21]
+
+    def test_different_keys_do_not_wait_on_each_other(self):
+        release = threading.Event()
+
+        @ttl_cache(ttl=60)
+        def fetch(x):
+            if x == "slow":
+                release.wait(5)
+            return x
+
+        slow = threading.Thread(target=fetch, args=("slow",))
+        slow.start()
+        try:
+            assert fetch("fast") == "fast"
+        finally:
+            release.set()
+            slow.join(5)
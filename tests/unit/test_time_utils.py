@@ -0,0 +1,48 @@
+"""
+Tests for feed date parsing in utils.time_utils.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from utils.time_utils import parse_feed_datetime
+
+
+def _local(*args, offset=0):
+    """Naive server-local datetime for an instant given at a UTC offset in hours."""
+    aware = datetime(*args, tzinfo=timezone(timedelta(hours=offset)))
+    return aware.astimezone().replace(tzinfo=None)
+
+
+class TestParseFeedDatetime:
+    @pytest.mark.parametrize("value, expected", [
+        ("Fri, 12 Jul 2025 10:00:00 GMT", _local(2025, 7, 12, 10, 0)),
+        ("Fri, 12 Jul 2025 16:00:00 +0600", _local(2025, 7, 12, 10, 0)),
+        ("Fri, 12 Jul 2025 06:00:00 -0400", _local(2025, 7, 12, 10, 0)),
+    ])
+    def test_rfc_822(self, value, expected):
+        assert parse_feed_datetime(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2025-07-12T10:00:00Z", _local(2025, 7, 12, 10, 0)),
+        ("2025-07-12T10:00:00.250Z", _local(2025, 7, 12, 10, 0, 0, 250000)),
+        ("2025-07-12T16:00:00+06:00", _local(2025, 7, 12, 10, 0)),
+    ])
+    def test_iso_8601(self, value, expected):
+        assert parse_feed_datetime(value) == expected
+
+    def test_naive_iso_8601_is_kept_as_is(self):
+        assert parse_feed_datetime("2025-07-12T10:00:00") == datetime(2025, 7, 12, 10, 0)
+
+    def test_struct_time_is_utc(self):
+        value = time.strptime("2025-07-12 10:00:00", "%Y-%m-%d %H:%M:%S")
+        assert parse_feed_datetime(value) == _local(2025, 7, 12, 10, 0)
+
+    def test_fallback_formats(self):
+        assert parse_feed_datetime("12/07/2025 10:00:00") == datetime(2025, 7, 12, 10, 0)
+        assert parse_feed_datetime("2025/07/12 10:00:00") == datetime(2025, 7, 12, 10, 0)
+
+    @pytest.mark.parametrize("value", [None, "", "   ", "yesterday", "2025-13-45T99:00:00"])
+    def test_unparseable_returns_none(self, value):
+        assert parse_feed_datetime(value) is None
@@ -6,6 +6,8 @@ This package provides utility functions and helpers for the Choy News bot.
 
 from .logging import setup_logging, get_logger
 from .config import Config
+from .cache import ttl_cache, TTLCache
+from .rate_limit import TokenBucket
 from .time_utils import (
     get_bd_now,
     get_bd_time_str,
@@ -14,13 +16,17 @@ from .time_utils import (
     parse_timezone_input,
     get_local_time_str,
     should_send_news,
-    time_in_range
+    time_in_range,
+    parse_feed_datetime
 )
 
 __all__ = [
     'setup_logging',
     'get_logger',
     'Config',
+    'ttl_cache',
+    'TTLCache',
+    'TokenBucket',
     'get_bd_now',
     'get_bd_time_str',
     'get_user_timezone',
@@ -28,5 +34,6 @@ __all__ = [
     'parse_timezone_input',
     'get_local_time_str',
     'should_send_news',
-    'time_in_range'
+    'time_in_range',
+    'parse_feed_datetime'
 ]
\ No newline at end of file
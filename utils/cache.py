@@ -0,0 +1,140 @@
+"""
+Caching utilities for the Choy News application.
+
+This module provides an in-memory, thread-safe TTL cache decorator used to
+collapse repeated upstream fetches (news digests, weather, crypto market data)
+that many users trigger within a short window, and a bounded TTL/LRU mapping
+for callers that manage their own keys.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded cache with a per-entry time-to-live.
+
+    Entries are kept in least-recently-used order; inserting past ``maxsize``
+    evicts the oldest one, and expired entries are dropped when looked up,
+    so no periodic sweep is needed.
+    """
+
+    def __init__(self, maxsize=256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries held
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for ``key``, or ``default`` if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl):
+        """
+        Store ``value`` under ``key`` for ``ttl`` seconds.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+def ttl_cache(ttl, maxsize=128, cache_if=None):
+    """
+    Cache a function's return values for ``ttl`` seconds.
+
+    Results are keyed on the call arguments and evicted least-recently-used
+    once ``maxsize`` entries are held. Concurrent misses for the same key are
+    coalesced: one caller runs the function while the others wait for and
+    share its result. Exceptions are not cached, and neither are results
+    rejected by ``cache_if``, so a degraded fallback is not served for the
+    whole TTL.
+
+    Args:
+        ttl (float): Time-to-live of a cached result in seconds
+        maxsize (int): Maximum number of cached results
+        cache_if (callable, optional): Predicate called with each result;
+            results for which it returns false are returned but not cached
+
+    Returns:
+        callable: Decorator that adds caching to a function. The wrapped
+        function exposes ``cache_clear()`` to drop all cached results.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        # Per-key locks for misses currently being computed
+        inflight = {}
+
+        def lookup(key):
+            entry = cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                cache.move_to_end(key)
+                return True, entry[1]
+            return False, None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+            with lock:
+                hit, value = lookup(key)
+                if hit:
+                    return value
+                key_lock = inflight.setdefault(key, threading.Lock())
+
+            with key_lock:
+                # Another caller may have filled the entry while we waited
+                with lock:
+                    hit, value = lookup(key)
+                if hit:
+                    return value
+
+                try:
+                    value = func(*args, **kwargs)
+                    if cache_if is not None and not cache_if(value):
+                        return value
+                    with lock:
+                        cache[key] = (time.monotonic() + ttl, value)
+                        cache.move_to_end(key)
+                        while len(cache) > maxsize:
+                            cache.popitem(last=False)
+                finally:
+                    with lock:
+                        if inflight.get(key) is key_lock:
+                            del inflight[key]
+                return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
@@ -47,6 +47,13 @@ class Config:
     LOG_MAX_BYTES = 10 * 1024 * 1024  # 10 MB per log file
     LOG_BACKUP_COUNT = 5  # Keep up to 5 backup log files
 
+    # HTTP timeout in seconds for outbound API requests
+    REQUEST_TIMEOUT = 10
+
+    # Cache settings for upstream API results
+    CRYPTO_CACHE_TTL = 300  # 5 minutes
+    WEATHER_CACHE_TTL = 1800  # 30 minutes
+
     @classmethod
     def validate_required_config(cls):
         """Validate that required configuration is present."""
@@ -0,0 +1,68 @@
+"""
+Rate limiting utilities for the Choy News application.
+
+This module provides a thread-safe token bucket used to pace outbound API
+calls (Telegram sends, upstream news and market APIs) so bursts are smoothed
+out locally instead of being rejected with HTTP 429 by the remote side.
+"""
+
+import threading
+import time
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers that find the bucket empty reserve tokens ahead of time and are
+    told how long to wait, so concurrent callers are served in order without
+    spinning.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of tokens (burst size)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1.0):
+        """
+        Take tokens from the bucket, going into debt if it is empty.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds the caller must wait before proceeding (0 if none)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1.0):
+        """
+        Block until the requested tokens are available.
+
+        Args:
+            tokens (float): Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -5,8 +5,11 @@ This module provides functions for handling time zones, formatting timestamps,
 and scheduling logic based on time conditions.
 """
 
+import calendar
 import sqlite3
+import time
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pytz import timezone as pytz_timezone, all_timezones
 from timezonefinder import TimezoneFinder
 from .config import Config
@@ -288,3 +291,64 @@ def time_in_range(start, end, current):
     else:
         # Handle overnight ranges (e.g., 22:00 to 06:00)
         return start_mins <= current_mins or current_mins <= end_mins
+
+# Formats tried, in order, for feed dates that are neither RFC 822 nor ISO 8601
+_FEED_DATE_FALLBACK_FORMATS = (
+    "%d %b %Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%Y/%m/%d %H:%M:%S"
+)
+
+def parse_feed_datetime(value):
+    """
+    Parse a date from an RSS/Atom feed.
+    
+    A time.struct_time (feedparser's ``published_parsed``, always UTC) is
+    converted directly. RFC 822 dates ("Mon, 13 Jan 2025 10:00:00 GMT") go
+    to the C-backed email.utils parser and ISO 8601 dates to
+    datetime.fromisoformat; only other shapes fall back to a short strptime
+    cascade.
+    
+    Args:
+        value (str or time.struct_time): Date as found in the feed
+        
+    Returns:
+        datetime: Naive datetime in server local time, or None if unparseable
+    """
+    if isinstance(value, time.struct_time):
+        try:
+            return datetime.fromtimestamp(calendar.timegm(value))
+        except (OverflowError, OSError, ValueError):
+            return None
+    
+    value = (value or "").strip()
+    if not value:
+        return None
+    
+    parsed = None
+    try:
+        if value[0].isalpha():
+            # RFC 822, usually with a weekday prefix
+            parsed = parsedate_to_datetime(value)
+        elif value[:4].isdigit() and value[4:5] == "-":
+            parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        parsed = None
+    
+    if parsed is None:
+        for fmt in _FEED_DATE_FALLBACK_FORMATS:
+            try:
+                parsed = datetime.strptime(value[:19], fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            try:
+                parsed = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed